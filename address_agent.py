@@ -1,51 +1,76 @@
 """Main agent module for OneTrueAddress - compares addresses using Claude."""
-from typing import Dict, Any, Optional, List
-from golden_source import GoldenSourceConnector
-from claude_client import ClaudeClient
-from config import CONFIDENCE_THRESHOLD
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+from golden_source import GoldenSourceConnector, QueryTimeoutError
+from claude_client import ClaudeClient, extract_json_object
+from config import CONFIDENCE_THRESHOLD, AUTO_ACCEPT_CONFIDENCE, NEAR_MATCH_MAX_DISTANCE
+from levenshtein import levenshtein
 import json
-import re
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of Claude match responses kept in the review cache
+REVIEW_CACHE_SIZE = 1024
+
+# Full street type names and their abbreviations (types without one are already canonical)
+_STREET_TYPE_ABBREVIATIONS = {
+    'street': 'st', 'avenue': 'ave', 'road': 'rd', 'drive': 'dr', 'lane': 'ln',
+    'court': 'ct', 'circle': 'cir', 'boulevard': 'blvd', 'place': 'pl', 'terrace': 'ter',
+    'parkway': 'pkwy', 'highway': 'hwy', 'trail': 'trl', 'plaza': 'plz', 'alley': 'aly',
+    'square': 'sq', 'crossing': 'xing', 'point': 'pt', 'crescent': 'cres'
+}
+
+
+def _normalize_field(value: Any) -> str:
+    """Strip and lowercase a field value for case-insensitive exact comparison."""
+    return value.strip().lower() if isinstance(value, str) else str(value).strip().lower()
+
+
+def _normalize_text(value: Any) -> str:
+    """Lowercase a value and collapse commas, trailing periods and whitespace for comparison."""
+    if value is None:
+        return ''
+    return " ".join(token.rstrip('.') for token in str(value).lower().replace(',', ' ').split())
+
+
+def _normalize_address1(value: Any) -> str:
+    """Normalize like _normalize_text, with a trailing street type in canonical form ('Main Street' == 'Main St')."""
+    tokens = _normalize_text(value).split()
+    if len(tokens) > 1:
+        tokens[-1] = _STREET_TYPE_ABBREVIATIONS.get(tokens[-1], tokens[-1])
+    return " ".join(tokens)
 
 
 class AddressAgent:
     """Main agent that orchestrates address matching using Claude."""
     
-    def __init__(self, claude_api_key: Optional[str] = None):
-        """Initialize the address agent."""
-        self.claude_client = ClaudeClient(claude_api_key)
-        self.golden_source = GoldenSourceConnector()
-    
-    def _check_exact_match(self, golden_address: Dict[str, Any], pinellas_matches: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def __init__(self, claude_api_key: Optional[str] = None, claude_client: Optional[ClaudeClient] = None):
         """
-        Check if the Golden Source address exactly matches any of the Pinellas (Internal) addresses.
+        Initialize the address agent.
         
         Args:
-            golden_address: The matched address from golden_source
-            pinellas_matches: List of internal addresses from Pinellas table
-            
-        Returns:
-            Dictionary with 'is_exact_match' boolean and optional 'matched_record' if exact match found
+            claude_api_key: Claude API key (defaults to CLAUDE_API_KEY)
+            claude_client: Existing ClaudeClient to reuse, so several agents share one connection pool
         """
-        if not pinellas_matches or len(pinellas_matches) == 0:
-            return {"is_exact_match": False}
-        
-        # Extract the primary address fields from golden_address
-        golden_addr1 = str(golden_address.get('address1', '')).strip().lower()
-        golden_city = str(golden_address.get('Mailing City', '')).strip().lower()
-        golden_state = str(golden_address.get('state', '')).strip().lower()
-        golden_zip = str(golden_address.get('zipcode', '')).strip().lower()
-        
-        # Try to find the address field name in pinellas records
-        if not pinellas_matches:
-            return {"is_exact_match": False}
-        
-        sample_record = pinellas_matches[0]
+        self.claude_client = claude_client or ClaudeClient(claude_api_key)
+        self.golden_source = GoldenSourceConnector()
+        # Claude match responses keyed by (normalized input, candidate set), LRU-bounded
+        self._review_cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self._review_cache_lock = threading.Lock()
+        # Internal record column names keyed by the record's key set; the
+        # Pinellas schema doesn't change within a session
+        self._schema_cache: Dict[frozenset, Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]] = {}
+    
+    def _detect_internal_columns(self, sample_record: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+        """Find the (address, city, state, zip) column names in an internal record (case-insensitive)."""
         address_col = None
         city_col = None
         state_col = None
         zip_col = None
         
-        # Find column names (case-insensitive)
         for key in sample_record.keys():
             key_lower = key.lower()
             if 'address' in key_lower or 'street' in key_lower:
@@ -61,25 +86,171 @@ class AddressAgent:
                 if zip_col is None:
                     zip_col = key
         
-        # Check each internal address for exact match
+        return address_col, city_col, state_col, zip_col
+    
+    def _check_exact_match(self, golden_address: Dict[str, Any], pinellas_matches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Check if the Golden Source address exactly matches any of the Pinellas (Internal) addresses.
+        
+        Args:
+            golden_address: The matched address from golden_source
+            pinellas_matches: List of internal addresses from Pinellas table
+            
+        Returns:
+            Dictionary with 'is_exact_match' boolean and optional 'matched_record' if exact match found.
+            Without an exact match, 'is_near_match', 'near_match_record' and 'edit_distance' describe
+            the closest internal address within NEAR_MATCH_MAX_DISTANCE edits, if any.
+        """
+        if not pinellas_matches or len(pinellas_matches) == 0:
+            return {"is_exact_match": False}
+        
+        # Normalize the primary address fields from golden_address once
+        golden_key = (
+            _normalize_field(golden_address.get('address1', '')),
+            _normalize_field(golden_address.get('Mailing City', '')),
+            _normalize_field(golden_address.get('state', '')),
+            _normalize_field(golden_address.get('zipcode', ''))
+        )
+        golden_addr1 = golden_key[0]
+        
+        sample_record = pinellas_matches[0]
+        schema_key = frozenset(sample_record.keys())
+        cols = self._schema_cache.get(schema_key)
+        if cols is None:
+            cols = self._detect_internal_columns(sample_record)
+            self._schema_cache[schema_key] = cols
+        address_col, city_col, state_col, zip_col = cols
+        
+        # Check each internal address for exact match (case-insensitive).
+        # The address field is compared first since it rejects most candidates.
         for pinellas_record in pinellas_matches:
-            pinellas_addr = str(pinellas_record.get(address_col, '')).strip().lower() if address_col else ''
-            pinellas_city = str(pinellas_record.get(city_col, '')).strip().lower() if city_col else ''
-            pinellas_state = str(pinellas_record.get(state_col, '')).strip().lower() if state_col else ''
-            pinellas_zip = str(pinellas_record.get(zip_col, '')).strip().lower() if zip_col else ''
+            pinellas_addr = _normalize_field(pinellas_record.get(address_col, '')) if address_col else ''
+            if pinellas_addr != golden_addr1:
+                continue
             
-            # Check if all fields match exactly (case-insensitive)
-            if (golden_addr1 == pinellas_addr and 
-                golden_city == pinellas_city and 
-                golden_state == pinellas_state and 
-                golden_zip == pinellas_zip):
+            pinellas_key = (
+                pinellas_addr,
+                _normalize_field(pinellas_record.get(city_col, '')) if city_col else '',
+                _normalize_field(pinellas_record.get(state_col, '')) if state_col else '',
+                _normalize_field(pinellas_record.get(zip_col, '')) if zip_col else ''
+            )
+            if pinellas_key == golden_key:
                 return {
                     "is_exact_match": True,
                     "matched_record": pinellas_record
                 }
         
+        # No exact match - look for a near-duplicate (e.g. punctuation or a typo)
+        golden_str = "|".join(golden_key)
+        best_distance = NEAR_MATCH_MAX_DISTANCE + 1
+        near_match_record = None
+        for pinellas_record in pinellas_matches:
+            pinellas_str = "|".join((
+                _normalize_field(pinellas_record.get(address_col, '')) if address_col else '',
+                _normalize_field(pinellas_record.get(city_col, '')) if city_col else '',
+                _normalize_field(pinellas_record.get(state_col, '')) if state_col else '',
+                _normalize_field(pinellas_record.get(zip_col, '')) if zip_col else ''
+            ))
+            # The length difference is a lower bound on the edit distance
+            if abs(len(pinellas_str) - len(golden_str)) >= best_distance:
+                continue
+            distance = levenshtein(golden_str, pinellas_str)
+            if distance < best_distance:
+                best_distance = distance
+                near_match_record = pinellas_record
+        
+        if near_match_record is not None:
+            return {
+                "is_exact_match": False,
+                "is_near_match": True,
+                "near_match_record": near_match_record,
+                "edit_distance": best_distance
+            }
+        
         return {"is_exact_match": False}
     
+    def _find_unambiguous_candidate(self, search_criteria: Dict[str, Any], address_table: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Return the single candidate that matches every extracted address component, if there is one.
+        
+        Only used when extraction confidence reaches AUTO_ACCEPT_CONFIDENCE. Street number, street
+        name and state must have been extracted; street type, city and zip are compared when present.
+        Candidates with an address2 (unit) are never auto-accepted, since the extraction has no unit field.
+        
+        Returns:
+            The matching candidate row, or None if Claude should decide
+        """
+        extraction_confidence = search_criteria.get("confidence")
+        if not isinstance(extraction_confidence, (int, float)) or extraction_confidence < AUTO_ACCEPT_CONFIDENCE:
+            return None
+        
+        street_number = search_criteria.get("street_number")
+        street_name = search_criteria.get("street_name")
+        state = search_criteria.get("state")
+        if not street_number or not street_name or not state:
+            return None
+        
+        expected_address1 = _normalize_address1(
+            " ".join(str(part) for part in (street_number, street_name, search_criteria.get("street_type")) if part)
+        )
+        expected_city = _normalize_text(search_criteria.get("city"))
+        expected_state = _normalize_text(state)
+        expected_zip = str(search_criteria.get("zip_code") or '').strip()[:5]
+        
+        match = None
+        for candidate in address_table:
+            if _normalize_address1(candidate.get('address1')) != expected_address1:
+                continue
+            if _normalize_text(candidate.get('address2')):
+                continue
+            if _normalize_text(candidate.get('state')) != expected_state:
+                continue
+            if expected_city and _normalize_text(candidate.get('Mailing City')) != expected_city:
+                continue
+            if expected_zip and str(candidate.get('zipcode') or '').strip()[:5] != expected_zip:
+                continue
+            if match is not None:
+                # More than one candidate fits - let Claude decide
+                return None
+            match = candidate
+        
+        return match
+    
+    def _find_address_match_cached(self, input_address: str, address_table: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], str]:
+        """
+        Ask Claude for the match, reusing a previous response for the same input and candidates.
+        
+        Retries of the same address against the same filtered subset would otherwise
+        send an identical prompt to Claude. Only responses that parse to a JSON answer
+        with "match_found" are cached.
+        """
+        cache_key = (
+            " ".join(input_address.lower().split()),
+            json.dumps(address_table, sort_keys=True, default=str)
+        )
+        
+        with self._review_cache_lock:
+            cached = self._review_cache.get(cache_key)
+            if cached is not None:
+                self._review_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("Using cached Claude response for this address and candidate set")
+            return cached
+        
+        result = self.claude_client.find_address_match(input_address, address_table)
+        
+        # Only cache usable answers, so a retry after prose or a truncated reply asks Claude again
+        parsed = extract_json_object(result[0]["response"])
+        if not isinstance(parsed, dict) or "match_found" not in parsed:
+            return result
+        
+        with self._review_cache_lock:
+            self._review_cache[cache_key] = result
+            self._review_cache.move_to_end(cache_key)
+            while len(self._review_cache) > REVIEW_CACHE_SIZE:
+                self._review_cache.popitem(last=False)
+        return result
+    
     def match_address(self, input_address: str) -> Dict[str, Any]:
         """
         Match an input address against the golden source table using a two-step approach:
@@ -94,34 +265,40 @@ class AddressAgent:
             Dictionary containing the match result
         """
         # Step 1: Extract search criteria from input address
-        print("Step 1: Extracting search criteria from input address...")
+        logger.info("Step 1: Extracting search criteria from input address...")
         search_criteria = self.claude_client.extract_search_criteria(input_address)
-        print(f"Extracted search criteria: {search_criteria}")
+        logger.info("Extracted search criteria: %s", search_criteria)
         
         # Log confidence from search criteria extraction
         extraction_confidence = search_criteria.get("confidence")
         if extraction_confidence is not None:
-            print(f"Extraction Confidence: {extraction_confidence}%")
+            logger.info("Extraction Confidence: %s%%", extraction_confidence)
             if extraction_confidence < CONFIDENCE_THRESHOLD:
-                print(f"⚠️  WARNING: Extraction confidence ({extraction_confidence}%) is below threshold ({CONFIDENCE_THRESHOLD}%)")
+                logger.warning("⚠️  WARNING: Extraction confidence (%s%%) is below threshold (%s%%)",
+                               extraction_confidence, CONFIDENCE_THRESHOLD)
         else:
-            print("⚠️  WARNING: No confidence value returned from extraction")
+            logger.warning("⚠️  WARNING: No confidence value returned from extraction")
         
         # Step 2: Get filtered addresses from golden source
-        print("\nStep 2: Querying database with search criteria...")
-        address_table = self.golden_source.get_filtered_addresses(search_criteria, limit=50)
-        print(f"\n{'='*60}")
-        print(f"FILTERED SUBSET: {len(address_table)} records")
-        print(f"{'='*60}")
-        
-        if address_table:
-            print("\nAddresses in filtered subset:")
-            print("-" * 60)
-            for idx, addr in enumerate(address_table, 1):
-                # Format address for display (show all fields)
-                addr_str = " | ".join([f"{k}: {v}" for k, v in addr.items()])
-                print(f"{idx}. {addr_str}")
-            print("-" * 60)
+        logger.info("Step 2: Querying database with search criteria...")
+        try:
+            address_table = self.golden_source.get_filtered_addresses(search_criteria, limit=50)
+        except QueryTimeoutError as e:
+            # A cancelled query says nothing about whether candidates exist
+            return {
+                "input_address": input_address,
+                "claude_response": {
+                    "match_found": False,
+                    "reasoning": f"The database query timed out before returning candidates ({e}). Please try again."
+                },
+                "raw_response": "Database query timed out",
+                "candidates_searched": 0,
+                "query_timed_out": True
+            }
+        logger.info("FILTERED SUBSET: %d records", len(address_table))
+        
+        if address_table and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Addresses in filtered subset:\n%s", self._format_records(address_table))
         
         if not address_table:
             return {
@@ -134,38 +311,46 @@ class AddressAgent:
                 "candidates_searched": 0
             }
         
-        # Step 3: Ask Claude to find the exact match from filtered candidates
-        print(f"\nStep 3: Querying Claude to find exact match from {len(address_table)} candidates...")
-        claude_response, final_prompt = self.claude_client.find_address_match(input_address, address_table)
-        
-        # Log the final prompt sent to Claude
-        print(f"\n{'='*60}")
-        print("FINAL PROMPT SENT TO CLAUDE:")
-        print(f"{'='*60}")
-        print(final_prompt)
-        print(f"{'='*60}\n")
-        
-        # Try to parse JSON from Claude's response
-        parsed_result = self._parse_claude_response(claude_response["response"])
+        # Step 3: Ask Claude to find the exact match from filtered candidates, unless
+        # exactly one candidate already matches every extracted component
+        auto_match = self._find_unambiguous_candidate(search_criteria, address_table)
+        if auto_match is not None:
+            logger.info("Step 3: Skipping Claude review - one candidate matches every extracted component")
+            raw_response = "Auto-accepted: single candidate matches all extracted address components"
+            parsed_result = {
+                "match_found": True,
+                "matched_address": auto_match,
+                "confidence": extraction_confidence,
+                "reasoning": "The only candidate whose street number, street name, street type, city, state "
+                             "and zip code all match the components extracted from the input address.",
+                "auto_accepted": True
+            }
+        else:
+            logger.info("Step 3: Querying Claude to find exact match from %d candidates...", len(address_table))
+            claude_response, final_prompt = self._find_address_match_cached(input_address, address_table)
+            
+            # Log the final prompt sent to Claude
+            logger.debug("FINAL PROMPT SENT TO CLAUDE:\n%s", final_prompt)
+            
+            # Try to parse JSON from Claude's response
+            raw_response = claude_response["response"]
+            parsed_result = self._parse_claude_response(raw_response)
+            self._resolve_matched_address(parsed_result, address_table)
         
         # Log confidence from matching
         match_confidence = parsed_result.get("confidence") if isinstance(parsed_result, dict) else None
         if match_confidence is not None:
-            print(f"\n{'='*60}")
-            print(f"MATCH CONFIDENCE: {match_confidence}%")
-            print(f"{'='*60}")
+            logger.info("MATCH CONFIDENCE: %s%%", match_confidence)
             
             if match_confidence < CONFIDENCE_THRESHOLD:
-                print(f"⚠️  BUSINESS RULE EXCEPTION: Confidence ({match_confidence}%) is below threshold ({CONFIDENCE_THRESHOLD}%)")
-                print(f"⚠️  This match may require manual review.")
+                logger.warning("⚠️  BUSINESS RULE EXCEPTION: Confidence (%s%%) is below threshold (%s%%). "
+                               "This match may require manual review.", match_confidence, CONFIDENCE_THRESHOLD)
                 parsed_result["business_rule_exception"] = True
                 parsed_result["confidence_threshold"] = CONFIDENCE_THRESHOLD
             else:
                 parsed_result["business_rule_exception"] = False
         else:
-            print(f"\n{'='*60}")
-            print("⚠️  WARNING: No confidence value returned from matching")
-            print(f"{'='*60}")
+            logger.warning("⚠️  WARNING: No confidence value returned from matching")
             if isinstance(parsed_result, dict):
                 parsed_result["business_rule_exception"] = True
                 parsed_result["confidence_threshold"] = CONFIDENCE_THRESHOLD
@@ -174,56 +359,117 @@ class AddressAgent:
         pinellas_matches = []
         exact_match_info = {"is_exact_match": False}
         no_internal_match = False
+        pinellas_error = None
         
         if isinstance(parsed_result, dict) and parsed_result.get("match_found"):
             matched_address = parsed_result.get("matched_address")
             if matched_address:
-                print(f"\nStep 4: Searching for related addresses in pinellas_fl_baddatascearios...")
-                pinellas_matches = self.golden_source.get_pinellas_matches(matched_address)
-                print(f"Found {len(pinellas_matches)} related addresses in pinellas_fl_baddatascearios")
+                logger.info("Step 4: Searching for related addresses in pinellas_fl_baddatascearios...")
+                try:
+                    pinellas_matches = self.golden_source.get_pinellas_matches(matched_address)
+                except QueryTimeoutError as e:
+                    # Unknown rather than "no internal match", so don't offer to write the address
+                    logger.warning("⚠️  WARNING: Internal address lookup timed out: %s", e)
+                    pinellas_error = f"The internal address lookup timed out ({e}). Please try again."
+                logger.info("Found %d related addresses in pinellas_fl_baddatascearios", len(pinellas_matches))
                 
                 if pinellas_matches:
-                    print("\nPinellas matches:")
-                    print("-" * 60)
-                    for idx, addr in enumerate(pinellas_matches, 1):
-                        addr_str = " | ".join([f"{k}: {v}" for k, v in addr.items()])
-                        print(f"{idx}. {addr_str}")
-                    print("-" * 60)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Pinellas matches:\n%s", self._format_records(pinellas_matches))
                     
                     # Check if Golden Source exactly matches any Internal address
                     exact_match_info = self._check_exact_match(matched_address, pinellas_matches)
                     if exact_match_info.get("is_exact_match"):
-                        print("\n✓ EXACT MATCH FOUND: Golden Source address exactly matches an Internal address")
-                        print("  No update is needed for this address.")
+                        logger.info("✓ EXACT MATCH FOUND: Golden Source address exactly matches an Internal address. "
+                                    "No update is needed for this address.")
+                    elif exact_match_info.get("is_near_match"):
+                        logger.info("⚠️  No exact match found, but an Internal address is within %d edit(s) "
+                                    "of the Golden Source address. Internal addresses may need updates.",
+                                    exact_match_info["edit_distance"])
                     else:
-                        print("\n⚠️  No exact match found between Golden Source and Internal addresses")
-                        print("  Internal addresses may need updates.")
-                else:
-                    print("\n⚠️  No internal addresses found matching this Golden Source address")
-                    print("  Consider writing this Golden Source address to internal_updates table.")
+                        logger.info("⚠️  No exact match found between Golden Source and Internal addresses. "
+                                    "Internal addresses may need updates.")
+                elif pinellas_error is None:
+                    logger.info("⚠️  No internal addresses found matching this Golden Source address. "
+                                "Consider writing this Golden Source address to internal_updates table.")
                     no_internal_match = True
         
         return {
             "input_address": input_address,
             "claude_response": parsed_result,
-            "raw_response": claude_response["response"],
+            "raw_response": raw_response,
             "candidates_searched": len(address_table),
             "confidence_threshold": CONFIDENCE_THRESHOLD,
             "pinellas_matches": pinellas_matches,
             "exact_match_info": exact_match_info,
-            "no_internal_match": no_internal_match
+            "no_internal_match": no_internal_match,
+            "pinellas_error": pinellas_error
         }
     
-    def _parse_claude_response(self, response_text: str) -> Dict[str, Any]:
-        """Parse Claude's response, attempting to extract JSON if present."""
-        # Try to find JSON in the response
-        json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text, re.DOTALL)
+    def match_addresses_batch(self, input_addresses: List[str], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Match several input addresses concurrently.
+        
+        Each address goes through match_address on a worker thread so the Claude
+        round trips overlap; each database query checks out its own pooled connection.
+        
+        Args:
+            input_addresses: Free-form plain English addresses to match
+            max_workers: Maximum number of addresses matched at the same time
+            
+        Returns:
+            List of match results, in the same order as input_addresses
+        """
+        if not input_addresses:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(input_addresses))) as executor:
+            return list(executor.map(self.match_address, input_addresses))
+    
+    def _resolve_matched_address(self, parsed_result: Dict[str, Any], address_table: List[Dict[str, Any]]) -> None:
+        """
+        Replace Claude's 1-based "match_index" with the corresponding candidate row as "matched_address".
+        Any matched_address Claude sent itself is discarded, so the result only ever points at a real
+        database row; a match without an index that identifies a candidate turns into "no match".
+        """
+        parsed_result.pop("matched_address", None)
+        match_index = parsed_result.pop("match_index", None)
+        if not parsed_result.get("match_found"):
+            return
         
-        if json_match:
+        row = -1
+        if not isinstance(match_index, bool):
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
+                index_value = float(match_index)
+            except (TypeError, ValueError):
+                index_value = None
+            if index_value is not None and index_value.is_integer():
+                row = int(index_value) - 1
+        
+        if 0 <= row < len(address_table):
+            parsed_result["matched_address"] = address_table[row]
+        else:
+            # A match we can't point at is no match; don't report it as confident
+            logger.warning("⚠️  WARNING: Claude returned match_index %r, which does not identify one of the %d candidates",
+                           match_index, len(address_table))
+            parsed_result["match_found"] = False
+            parsed_result["reasoning"] = (
+                f"Claude reported a match but its match_index {match_index!r} does not identify one of the "
+                f"{len(address_table)} candidates. Original reasoning: {parsed_result.get('reasoning', 'N/A')}"
+            )
+    
+    def _format_records(self, records: List[Dict[str, Any]]) -> str:
+        """Format records one per line (all fields) for debug logging."""
+        return "\n".join(
+            f"{idx}. " + " | ".join(f"{k}: {v}" for k, v in record.items())
+            for idx, record in enumerate(records, 1)
+        )
+    
+    def _parse_claude_response(self, response_text: str) -> Dict[str, Any]:
+        """Parse Claude's response, attempting to extract JSON if present."""
+        parsed = extract_json_object(response_text)
+        if parsed is not None:
+            return parsed
         
         # If no JSON found, return the raw text
         return {
@@ -0,0 +1,109 @@
+"""Module for querying the golden source address table from asyncio code (PostgreSQL via asyncpg)."""
+import asyncio
+from typing import List, Dict, Any
+from config import (
+    GOLDEN_SOURCE_HOST,
+    GOLDEN_SOURCE_PORT,
+    GOLDEN_SOURCE_DATABASE,
+    GOLDEN_SOURCE_USER,
+    GOLDEN_SOURCE_PASSWORD,
+    GOLDEN_SOURCE_POOL_MIN,
+    GOLDEN_SOURCE_POOL_MAX,
+    GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS,
+    GOLDEN_SOURCE_WORK_MEM
+)
+from golden_source import (
+    QueryTimeoutError,
+    _PG_QUERY_CANCELED,
+    _build_filtered_query,
+    _to_numbered_placeholders,
+    _validate_credentials
+)
+
+
+class AsyncGoldenSourceConnector:
+    """
+    Async counterpart of GoldenSourceConnector.get_filtered_addresses for asyncio callers.
+    Each query acquires its own connection from an asyncpg pool, so concurrent tasks
+    (e.g. under asyncio.gather) never share a connection.
+    """
+
+    def __init__(self):
+        """Create an unconnected connector; call connect() (or use 'async with') before querying."""
+        self._pool = None
+        # Concurrent first queries would otherwise each create (and leak) a pool
+        self._pool_lock = asyncio.Lock()
+
+    async def connect(self):
+        """Create the asyncpg connection pool (once; later calls reuse it)."""
+        async with self._pool_lock:
+            if self._pool is not None:
+                return self
+
+            try:
+                import asyncpg
+            except ImportError:
+                raise ImportError("asyncpg is required for AsyncGoldenSourceConnector. Install with: pip install asyncpg")
+
+            _validate_credentials()
+
+            # Same session settings as the synchronous pool
+            server_settings = {}
+            if GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS > 0:
+                server_settings['statement_timeout'] = str(GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS)
+            if GOLDEN_SOURCE_WORK_MEM:
+                server_settings['work_mem'] = GOLDEN_SOURCE_WORK_MEM
+
+            self._pool = await asyncpg.create_pool(
+                host=GOLDEN_SOURCE_HOST,
+                port=int(GOLDEN_SOURCE_PORT) if GOLDEN_SOURCE_PORT else None,
+                database=GOLDEN_SOURCE_DATABASE,
+                user=GOLDEN_SOURCE_USER,
+                password=GOLDEN_SOURCE_PASSWORD,
+                min_size=GOLDEN_SOURCE_POOL_MIN,
+                max_size=GOLDEN_SOURCE_POOL_MAX,
+                server_settings=server_settings or None
+            )
+        return self
+
+    async def get_filtered_addresses(self, search_criteria: dict, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retrieve filtered addresses from the golden source table based on search criteria.
+        Builds the same query as GoldenSourceConnector.get_filtered_addresses.
+
+        Args:
+            search_criteria: Dictionary with search terms (street_number, street_name, city, state, street_type)
+            limit: Maximum number of addresses to return
+
+        Returns:
+            List of address dictionaries with only the specified columns
+        """
+        if self._pool is None:
+            await self.connect()
+
+        query, params, target_columns = _build_filtered_query(search_criteria, limit)
+
+        try:
+            async with self._pool.acquire() as connection:
+                # asyncpg prepares and caches statements per connection automatically
+                rows = await connection.fetch(_to_numbered_placeholders(query), *params)
+        except Exception as e:
+            if getattr(e, 'sqlstate', None) == _PG_QUERY_CANCELED:
+                raise QueryTimeoutError(f"Golden source query cancelled after {GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS} ms")
+            error_msg = str(e)
+            raise ValueError(f"Database query error: {error_msg}")
+
+        return [dict(zip(target_columns, row)) for row in rows]
+
+    async def close(self):
+        """Close the connection pool."""
+        async with self._pool_lock:
+            if self._pool is not None:
+                await self._pool.close()
+                self._pool = None
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -1,8 +1,112 @@
 """Module for interacting with Claude API."""
-from typing import Optional
-from anthropic import Anthropic
+import json
+from string import Template
+from typing import Any, Dict, Optional
+from anthropic import Anthropic, DefaultHttpxClient
 from config import CLAUDE_API_KEY
 
+try:
+    # Optional: faster parsing when the whole Claude response is a JSON object
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional: HTTP/2 for the Claude client (lets an early-stopped stream keep its connection)
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Invariant instructions for find_address_match, sent as a cacheable system prompt
+_MATCH_SYSTEM_PROMPT = """You are an expert at matching addresses. You will be given:
+1. An input address (in free-form plain English)
+2. A numbered table of known good addresses (the golden source)
+
+Your task is to find the EXACT match from the table that corresponds to the input address.
+
+Respond with a single JSON object and nothing else. If you find a match, use the row number from the table:
+{"match_found": true, "match_index": 3, "confidence": 95, "reasoning": "brief explanation of why this is the match"}
+
+If no exact match is found, return:
+{"match_found": false, "confidence": 0, "reasoning": "explanation of why no match was found"}
+
+The confidence field should be a numeric value from 0-100 indicating how confident you are in the match.
+- 90-100: Very high confidence, exact match
+- 70-89: High confidence, very close match with minor variations
+- 50-69: Medium confidence, similar but some differences
+- 0-49: Low confidence, uncertain match or no match
+
+Be very careful to match addresses exactly - consider variations in formatting, abbreviations,
+and minor spelling differences, but ensure the core address components match."""
+
+# Per-call user turn for find_address_match
+_MATCH_PROMPT_TEMPLATE = Template("""Input Address:
+$input_address
+
+Golden Source Address Table:
+$address_table""")
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the first JSON object found in a Claude response, or None if there isn't one.
+    
+    A bare JSON response is parsed in one call. Otherwise raw_decode is tried at each '{';
+    it stops at the end of the first complete object, so nested objects, code fences and
+    surrounding prose are handled without scanning characters in Python.
+    """
+    stripped = text.strip()
+    if stripped.startswith('{') and stripped.endswith('}'):
+        try:
+            obj = _json_loads(stripped)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+    
+    idx = text.find('{')
+    while idx >= 0:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, idx)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        idx = text.find('{', idx + 1)
+    
+    return None
+
+
+def _outer_object_complete(text: str) -> bool:
+    """
+    Return True once the JSON object starting at the first '{' in text has been fully received.
+    
+    Only the first '{' is tried: a nested object is complete before the outer one is,
+    so decoding from later positions would stop a streamed answer part-way through.
+    """
+    idx = text.find('{')
+    if idx < 0:
+        return False
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(text, idx)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(obj, dict)
+
+
+def _create_http_client() -> DefaultHttpxClient:
+    """
+    Create the long-lived HTTP client used for every Claude call.
+    
+    Connections are kept alive between calls so each request skips the TCP/TLS handshake.
+    HTTP/2 is enabled when the optional 'h2' package is installed.
+    """
+    # The SDK's default client already pools and keeps connections alive
+    return DefaultHttpxClient(http2=_HTTP2)
+
 
 class ClaudeClient:
     """Handles interactions with Claude API."""
@@ -18,7 +122,7 @@ class ClaudeClient:
                 f"Invalid API key format. Claude API keys should start with 'sk-ant-api'. "
                 f"Your key starts with: {self.api_key[:15]}..."
             )
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = Anthropic(api_key=self.api_key, http_client=_create_http_client())
     
     def extract_search_criteria(self, input_address: str) -> dict:
         """
@@ -66,11 +170,9 @@ Higher values indicate more certainty that the components are correctly identifi
             
             response_text = message.content[0].text
             # Try to parse JSON from response
-            import json
-            import re
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            parsed = extract_json_object(response_text)
+            if parsed is not None:
+                return parsed
             return {"raw_response": response_text}
         except Exception as e:
             raise ValueError(f"Failed to extract search criteria: {e}")
@@ -85,61 +187,48 @@ Higher values indicate more certainty that the components are correctly identifi
             
         Returns:
             Tuple of (response_dict, prompt_string) where response_dict contains Claude's response
-            and prompt_string is the full prompt that was sent to Claude
+            and prompt_string is the full prompt (system and user turn) that was sent to Claude.
+            A match is reported as "match_index", the 1-based row number in address_table.
         """
         # Format the address table for Claude
         address_table_str = self._format_address_table(address_table)
         
         # Create the prompt
-        prompt = f"""You are an expert at matching addresses. I will provide you with:
-1. An input address (in free-form plain English)
-2. A table of known good addresses (the golden source)
-
-Your task is to find the EXACT match from the table that corresponds to the input address.
-
-Input Address:
-{input_address}
-
-Golden Source Address Table:
-{address_table_str}
-
-Please analyze the input address and find the exact matching address from the table. 
-If you find a match, return it in JSON format with the following structure:
-{{
-    "match_found": true,
-    "matched_address": {{...all fields from the matched row...}},
-    "confidence": 95,
-    "reasoning": "brief explanation of why this is the match"
-}}
-
-If no exact match is found, return:
-{{
-    "match_found": false,
-    "confidence": 0,
-    "reasoning": "explanation of why no match was found"
-}}
-
-The confidence field should be a numeric value from 0-100 indicating how confident you are in the match.
-- 90-100: Very high confidence, exact match
-- 70-89: High confidence, very close match with minor variations
-- 50-69: Medium confidence, similar but some differences
-- 0-49: Low confidence, uncertain match or no match
-
-Be very careful to match addresses exactly - consider variations in formatting, abbreviations, 
-and minor spelling differences, but ensure the core address components match."""
+        prompt = _MATCH_PROMPT_TEMPLATE.substitute(
+            input_address=input_address,
+            address_table=address_table_str
+        )
         
-        # Call Claude API
+        # Call Claude API, streaming so we can stop as soon as the JSON answer is complete.
+        # Only over HTTP/2: on HTTP/1.1 closing a partly read response discards the
+        # keep-alive connection, costing the next call a new TCP/TLS handshake
+        message = None
+        chunks = []
         try:
-            message = self.client.messages.create(
+            with self.client.messages.stream(
                 model="claude-sonnet-4-5",
                 max_tokens=2048,
+                system=[
+                    {
+                        "type": "text",
+                        "text": _MATCH_SYSTEM_PROMPT,
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ],
                 messages=[
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ]
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    # Leaving the block closes the stream, so no further tokens are generated
+                    if _HTTP2 and '}' in text and _outer_object_complete(''.join(chunks)):
+                        break
+                else:
+                    message = stream.get_final_message()
         except Exception as e:
             # Provide more detailed error information
             error_msg = str(e)
@@ -153,14 +242,15 @@ and minor spelling differences, but ensure the core address components match."""
             raise
         
         # Extract the response
-        response_text = message.content[0].text
+        response_text = ''.join(chunks)
         
         response_dict = {
             "response": response_text,
+            # None when the stream was stopped early after a complete JSON answer (HTTP/2 only)
             "raw_message": message
         }
         
-        return response_dict, prompt
+        return response_dict, f"{_MATCH_SYSTEM_PROMPT}\n\n{prompt}"
     
     def _format_address_table(self, address_table: list) -> str:
         """Format the address table as a readable string for Claude.
@@ -177,11 +267,10 @@ and minor spelling differences, but ensure the core address components match."""
         separator = "-" * len(header)
         
         # Format rows
-        rows = []
-        for idx, address in enumerate(address_table, 1):
-            row_values = [str(address.get(col, "")) for col in display_columns]
-            row_str = " | ".join(row_values)
-            rows.append(f"{idx}. {row_str}")
+        rows = "\n".join(
+            f"{idx}. " + " | ".join(str(address.get(col, "")) for col in display_columns)
+            for idx, address in enumerate(address_table, 1)
+        )
         
-        return f"{header}\n{separator}\n" + "\n".join(rows)
+        return f"{header}\n{separator}\n{rows}"
 
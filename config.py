@@ -17,6 +17,38 @@ GOLDEN_SOURCE_USER = os.getenv("GOLDEN_SOURCE_USER")
 GOLDEN_SOURCE_PASSWORD = os.getenv("GOLDEN_SOURCE_PASSWORD")
 GOLDEN_SOURCE_TABLE = os.getenv("GOLDEN_SOURCE_TABLE", "addresses")
 
+# Connection Pool Configuration (PostgreSQL/MySQL)
+# Connections are shared across requests instead of opening one per connector
+GOLDEN_SOURCE_POOL_MIN = int(os.getenv("GOLDEN_SOURCE_POOL_MIN", "2"))
+GOLDEN_SOURCE_POOL_MAX = int(os.getenv("GOLDEN_SOURCE_POOL_MAX", "15"))
+# Seconds an operation waits for a free pooled connection before failing
+GOLDEN_SOURCE_POOL_TIMEOUT = float(os.getenv("GOLDEN_SOURCE_POOL_TIMEOUT", "30"))
+
+# Query Limits Configuration (PostgreSQL)
+# Session defaults for pooled connections: queries running longer than the timeout (milliseconds, default 0 = off)
+# are cancelled and reported as timeouts. WORK_MEM is a PostgreSQL size (e.g. "64MB"); empty keeps the server default
+GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS = int(os.getenv("GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS", "0"))
+GOLDEN_SOURCE_WORK_MEM = os.getenv("GOLDEN_SOURCE_WORK_MEM", "64MB").strip()
+# Log EXPLAIN (ANALYZE, BUFFERS) output at INFO level before each address query (debugging only)
+GOLDEN_SOURCE_EXPLAIN = os.getenv("GOLDEN_SOURCE_EXPLAIN", "false").strip().lower() in ("1", "true", "yes")
+
+# Search Index Configuration (PostgreSQL)
+# When enabled, the pg_trgm and covering indexes used by the address filters are ensured once per process
+# (the golden source table is vacuumed after a new index is built, so index-only scans are possible).
+# Requires privileges to create extensions/indexes; they can also be created via create_search_indexes()
+GOLDEN_SOURCE_CREATE_INDEXES = os.getenv("GOLDEN_SOURCE_CREATE_INDEXES", "false").strip().lower() in ("1", "true", "yes")
+
+# Query Cache Configuration
+# Filtered golden source lookups are reused for identical (normalized) search criteria.
+# Entries expire after the TTL in seconds; set either value to 0 to disable the cache
+GOLDEN_SOURCE_QUERY_CACHE_SIZE = int(os.getenv("GOLDEN_SOURCE_QUERY_CACHE_SIZE", "512"))
+GOLDEN_SOURCE_QUERY_CACHE_TTL = float(os.getenv("GOLDEN_SOURCE_QUERY_CACHE_TTL", "300"))
+
+# Local Pinellas Index Configuration
+# When enabled, the Pinellas table is loaded into memory once per process on first connect and
+# Pinellas lookups are answered without a query. Uses memory proportional to the table size
+GOLDEN_SOURCE_LOCAL_INDEX = os.getenv("GOLDEN_SOURCE_LOCAL_INDEX", "false").strip().lower() in ("1", "true", "yes")
+
 # Pinellas FL Bad Data Scenarios Table Configuration
 # Note: Use schema-qualified name if needed (e.g., "team_cool_and_gang.pinellas_fl_baddatascenarios")
 PINELLAS_TABLE = os.getenv("PINELLAS_TABLE", "team_cool_and_gang.pinellas_fl_baddatascenarios")
@@ -24,3 +56,15 @@ PINELLAS_TABLE = os.getenv("PINELLAS_TABLE", "team_cool_and_gang.pinellas_fl_bad
 # Confidence Threshold Configuration
 CONFIDENCE_THRESHOLD = float(os.getenv("CONFIDENCE_THRESHOLD", "90.0"))  # Default 90%
 
+# Auto-Accept Configuration
+# Skip the Claude matching call when extraction confidence is at least this value and exactly
+# one candidate matches every extracted address component. Set above 100 to always ask Claude.
+AUTO_ACCEPT_CONFIDENCE = float(os.getenv("AUTO_ACCEPT_CONFIDENCE", "95.0"))  # Default 95%
+
+# Near Match Configuration
+# When no internal address matches exactly, report the closest one within this many character edits
+NEAR_MATCH_MAX_DISTANCE = int(os.getenv("NEAR_MATCH_MAX_DISTANCE", "2"))
+
+# Logging Configuration
+# Default WARNING; INFO logs each matching step and query result counts, DEBUG also logs SQL queries, candidate records and prompts
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").strip().upper()
@@ -1,6 +1,15 @@
 """Module for connecting to and querying the golden source address table."""
+import hashlib
+import itertools
+import logging
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from config import (
     GOLDEN_SOURCE_DB_TYPE,
     GOLDEN_SOURCE_HOST,
@@ -9,135 +18,548 @@ from config import (
     GOLDEN_SOURCE_USER,
     GOLDEN_SOURCE_PASSWORD,
     GOLDEN_SOURCE_TABLE,
+    GOLDEN_SOURCE_POOL_MIN,
+    GOLDEN_SOURCE_POOL_MAX,
+    GOLDEN_SOURCE_POOL_TIMEOUT,
+    GOLDEN_SOURCE_CREATE_INDEXES,
+    GOLDEN_SOURCE_QUERY_CACHE_SIZE,
+    GOLDEN_SOURCE_QUERY_CACHE_TTL,
+    GOLDEN_SOURCE_LOCAL_INDEX,
+    GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS,
+    GOLDEN_SOURCE_WORK_MEM,
+    GOLDEN_SOURCE_EXPLAIN,
     PINELLAS_TABLE
 )
 
+logger = logging.getLogger(__name__)
+
+# Process-wide connection pool (PostgreSQL or MySQL), shared by every GoldenSourceConnector.
+# _POOL_USERS counts the open connectors; the pool is closed when the last one closes.
+_POOL = None
+_POOL_USERS = 0
+_POOL_LOCK = threading.Lock()
+
+# Bounds concurrent checkouts to the pool size: the drivers raise instead of waiting
+# when every connection is in use
+_POOL_SLOTS = threading.BoundedSemaphore(GOLDEN_SOURCE_POOL_MAX)
+
+# Names of the statements PREPAREd on each pooled PostgreSQL connection
+_PREPARED = weakref.WeakKeyDictionary()
+_PREPARED_LOCK = threading.Lock()
+
+# Table written by push_to_internal_updates
+_INTERNAL_UPDATES_TABLE = "team_cool_and_gang.internal_updates"
+
+# Set once the search indexes have been ensured (see GOLDEN_SOURCE_CREATE_INDEXES)
+_INDEXES_ENSURED = False
+
+# Set once the local Pinellas index has been requested (see GOLDEN_SOURCE_LOCAL_INDEX)
+_LOCAL_INDEX_REQUESTED = False
+
+# Common street type suffixes (abbreviations and full names)
+_STREET_TYPES = frozenset({
+    'street', 'st', 'avenue', 'ave', 'road', 'rd', 'drive', 'dr',
+    'lane', 'ln', 'court', 'ct', 'circle', 'cir', 'boulevard', 'blvd',
+    'way', 'place', 'pl', 'terrace', 'ter', 'parkway', 'pkwy',
+    'highway', 'hwy', 'trail', 'trl', 'plaza', 'plz', 'alley', 'aly',
+    'loop', 'square', 'sq', 'crossing', 'xing', 'run', 'point', 'pt',
+    'pike', 'row', 'path', 'walk', 'commons', 'green', 'crescent', 'cres'
+})
+
+# Rows fetched per round trip when streaming whole tables
+_STREAM_BATCH_SIZE = 10000
+
+# SQLSTATE raised when statement_timeout cancels a query
+_PG_QUERY_CANCELED = '57014'
+
+class QueryTimeoutError(ValueError):
+    """Raised when the statement timeout cancels a query, so callers can tell it apart from no rows."""
+
+def _escape_like(value: Any) -> str:
+    """Escape LIKE wildcards so the value matches literally (backslash is the default escape)."""
+    return str(value).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _quote_column(column: str, known_columns) -> str:
+    """
+    Quote a column name for interpolation into SQL, allowing only columns that table
+    introspection actually reported. Raises ValueError for anything else.
+    """
+    if column not in known_columns:
+        raise ValueError(f"Unknown column: {column!r}")
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _validate_credentials():
+    """Raise if any of the required server connection settings is missing."""
+    if not GOLDEN_SOURCE_HOST:
+        raise ValueError("GOLDEN_SOURCE_HOST environment variable is not set")
+    if not GOLDEN_SOURCE_DATABASE:
+        raise ValueError("GOLDEN_SOURCE_DATABASE environment variable is not set")
+    if not GOLDEN_SOURCE_USER:
+        raise ValueError("GOLDEN_SOURCE_USER environment variable is not set")
+    if not GOLDEN_SOURCE_PASSWORD:
+        raise ValueError("GOLDEN_SOURCE_PASSWORD environment variable is not set")
+
+
+def _postgres_uri() -> str:
+    """Build a postgresql:// URI from the configured credentials (for drivers that want a URI)."""
+    from urllib.parse import quote
+    return (
+        f"postgresql://{quote(GOLDEN_SOURCE_USER, safe='')}:{quote(GOLDEN_SOURCE_PASSWORD, safe='')}"
+        f"@{GOLDEN_SOURCE_HOST}:{GOLDEN_SOURCE_PORT or 5432}/{quote(GOLDEN_SOURCE_DATABASE, safe='')}"
+    )
+
+
+def _create_postgres_pool():
+    """Create the PostgreSQL connection pool, translating connection errors into readable messages."""
+    try:
+        import psycopg2
+        import psycopg2.pool
+    except ImportError:
+        raise ImportError("psycopg2 is required for PostgreSQL. Install with: pip install psycopg2-binary")
+    
+    _validate_credentials()
+    
+    # Session settings for every pooled connection, so runaway scans are cancelled
+    # instead of pinning a backend
+    session_options = []
+    if GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS > 0:
+        session_options.append(f'-c statement_timeout={GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS}')
+    if GOLDEN_SOURCE_WORK_MEM:
+        session_options.append(f'-c work_mem={GOLDEN_SOURCE_WORK_MEM}')
+    
+    try:
+        return psycopg2.pool.ThreadedConnectionPool(
+            minconn=GOLDEN_SOURCE_POOL_MIN,
+            maxconn=GOLDEN_SOURCE_POOL_MAX,
+            host=GOLDEN_SOURCE_HOST,
+            port=GOLDEN_SOURCE_PORT,
+            database=GOLDEN_SOURCE_DATABASE,
+            user=GOLDEN_SOURCE_USER,
+            password=GOLDEN_SOURCE_PASSWORD,
+            options=' '.join(session_options) or None
+        )
+    except Exception as e:
+        error_msg = str(e)
+        error_type = type(e).__name__
+        
+        # Check if it's an OperationalError (connection/auth issues)
+        if error_type == "OperationalError" or "OperationalError" in str(type(e)):
+            if "password authentication failed" in error_msg.lower():
+                raise ValueError(
+                    f"PostgreSQL authentication failed for user '{GOLDEN_SOURCE_USER}'.\n"
+                    f"Connection details: host={GOLDEN_SOURCE_HOST}, port={GOLDEN_SOURCE_PORT}, database={GOLDEN_SOURCE_DATABASE}\n"
+                    f"Please verify:\n"
+                    f"  1. The password in GOLDEN_SOURCE_PASSWORD is correct\n"
+                    f"  2. The user '{GOLDEN_SOURCE_USER}' exists and has access to the database\n"
+                    f"  3. The database server allows connections from your IP address\n"
+                    f"  4. Check your .env file or environment variables\n"
+                    f"\nOriginal error: {error_msg}"
+                )
+            elif "could not connect" in error_msg.lower() or "connection refused" in error_msg.lower():
+                raise ValueError(
+                    f"Could not connect to PostgreSQL server at {GOLDEN_SOURCE_HOST}:{GOLDEN_SOURCE_PORT}.\n"
+                    f"Please verify:\n"
+                    f"  1. The server is running and accessible\n"
+                    f"  2. The host and port are correct\n"
+                    f"  3. Your firewall allows connections to this server\n"
+                    f"\nOriginal error: {error_msg}"
+                )
+            else:
+                raise ValueError(f"PostgreSQL connection error: {error_msg}")
+        else:
+            raise ValueError(f"Failed to connect to PostgreSQL database: {error_msg}")
+
+
+def _create_mysql_pool():
+    """Create the MySQL connection pool, translating connection errors into readable messages."""
+    try:
+        import mysql.connector
+        import mysql.connector.pooling
+    except ImportError:
+        raise ImportError("mysql-connector-python is required for MySQL. Install with: pip install mysql-connector-python")
+    
+    _validate_credentials()
+    
+    try:
+        return mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="golden_source",
+            pool_size=GOLDEN_SOURCE_POOL_MAX,
+            host=GOLDEN_SOURCE_HOST,
+            port=GOLDEN_SOURCE_PORT,
+            database=GOLDEN_SOURCE_DATABASE,
+            user=GOLDEN_SOURCE_USER,
+            password=GOLDEN_SOURCE_PASSWORD
+        )
+    except mysql.connector.Error as e:
+        error_msg = str(e)
+        if "access denied" in error_msg.lower() or "authentication" in error_msg.lower():
+            raise ValueError(
+                f"MySQL authentication failed for user '{GOLDEN_SOURCE_USER}'.\n"
+                f"Connection details: host={GOLDEN_SOURCE_HOST}, port={GOLDEN_SOURCE_PORT}, database={GOLDEN_SOURCE_DATABASE}\n"
+                f"Please verify your credentials in the .env file or environment variables.\n"
+                f"\nOriginal error: {error_msg}"
+            )
+        else:
+            raise ValueError(f"MySQL connection error: {error_msg}")
+    except Exception as e:
+        raise ValueError(f"Failed to connect to MySQL database: {e}")
+
+
+def _get_pool(db_type: str):
+    """Return the shared connection pool for db_type, creating it on first use. Pair with _release_pool()."""
+    global _POOL, _POOL_USERS
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = _create_postgres_pool() if db_type == "postgresql" else _create_mysql_pool()
+        _POOL_USERS += 1
+        return _POOL
+
+
+def _release_pool():
+    """Drop one connector's reference to the shared pool, closing it when no connector is left."""
+    global _POOL_USERS
+    with _POOL_LOCK:
+        _POOL_USERS = max(_POOL_USERS - 1, 0)
+        # Same locked section, so a connector created meanwhile can't get the pool being closed
+        if not _POOL_USERS:
+            _close_pool_locked()
+
+
+def _close_pool_locked():
+    """Close the shared pool and reset its user count; the caller holds _POOL_LOCK."""
+    global _POOL, _POOL_USERS
+    if _POOL is not None and hasattr(_POOL, "closeall"):
+        _POOL.closeall()
+    _POOL = None
+    _POOL_USERS = 0
+
+
+def close_pool():
+    """
+    Close every connection in the shared pool; the next connector creates a new one.
+    Meant for process shutdown - connectors that are still open can't query afterwards.
+    """
+    with _POOL_LOCK:
+        _close_pool_locked()
+
+
+@contextmanager
+def _pool_slot():
+    """Wait (up to GOLDEN_SOURCE_POOL_TIMEOUT seconds) until a pooled connection can be checked out."""
+    if not _POOL_SLOTS.acquire(timeout=GOLDEN_SOURCE_POOL_TIMEOUT):
+        raise ValueError(
+            f"Timed out after {GOLDEN_SOURCE_POOL_TIMEOUT:g} s waiting for a free database connection "
+            f"(all {GOLDEN_SOURCE_POOL_MAX} pooled connections are in use; see GOLDEN_SOURCE_POOL_MAX)"
+        )
+    try:
+        yield
+    finally:
+        _POOL_SLOTS.release()
+
+
+def _to_numbered_placeholders(query: str) -> str:
+    """Convert psycopg2-style %s placeholders to PostgreSQL's $1..$n (and %% back to %)."""
+    counter = itertools.count(1)
+    return re.sub(r'%[s%]', lambda m: f'${next(counter)}' if m.group() == '%s' else '%', query)
+
+
+# Search criteria fields that get_filtered_addresses filters on
+_FILTER_FIELDS = ('state', 'city', 'street_number', 'street_name', 'street_type')
+
+
+def _canonical_criteria(search_criteria: dict) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Reduce search criteria to the fields used by the filter query, trimmed and whitespace-collapsed.
+    Fields matched with ILIKE are lower-cased; street_number is matched case-sensitively and kept as is.
+    """
+    canonical = []
+    for field in _FILTER_FIELDS:
+        value = search_criteria.get(field)
+        value = ' '.join(str(value).split()) if value else ''
+        if field != 'street_number':
+            value = value.lower()
+        canonical.append((field, value or None))
+    return tuple(canonical)
+
+
+def _build_filtered_query(search_criteria: dict, limit: int) -> Tuple[str, List[Any], List[str]]:
+    """
+    Build the golden source filter query for get_filtered_addresses.
+    Uses %s placeholders; returns (query, params, selected column names).
+    """
+    # Parse schema and table name if schema-qualified
+    table_parts = GOLDEN_SOURCE_TABLE.split('.')
+    if len(table_parts) == 2:
+        schema_name, table_name = table_parts
+        quoted_table = f'"{schema_name}"."{table_name}"'
+    else:
+        schema_name = None
+        table_name = GOLDEN_SOURCE_TABLE
+        quoted_table = f'"{table_name}"'
+    
+    # Define the specific columns we want to select
+    target_columns = ['address1', 'address2', 'Mailing City', 'state', 'zipcode']
+    quoted_columns = ', '.join([f'"{col}"' for col in target_columns])
+    
+    # Build WHERE clause based on search criteria
+    # Logic: state AND city AND street_number AND (street_name OR street_type in address1)
+    # State, City, and Street Number use AND logic (must match)
+    # Address1 searches (street_name, street_type) use OR logic
+    
+    params = []
+    and_conditions = []
+    address1_or_conditions = []
+    
+    # Filter by state (REQUIRED with AND logic)
+    # Two-letter codes use equality (btree-indexable, and 'MA' no longer matches inside other values)
+    state = search_criteria.get("state")
+    if state:
+        if len(str(state).strip()) == 2:
+            and_conditions.append('"state" = %s')
+            params.append(str(state).strip().upper())
+        else:
+            and_conditions.append('"state"::text ILIKE %s')
+            params.append(f'%{state}%')
+    
+    # Filter by city (REQUIRED with AND logic)
+    city = search_criteria.get("city")
+    if city:
+        and_conditions.append('"Mailing City"::text ILIKE %s')
+        params.append(f'%{city}%')
+    
+    # Filter by street_number (REQUIRED with AND logic - must match start of address1)
+    # Case-sensitive anchored LIKE so a text_pattern_ops index can be used
+    street_number = search_criteria.get("street_number")
+    if street_number:
+        and_conditions.append('"address1"::text LIKE %s')
+        params.append(f'{_escape_like(street_number)}%')
+    
+    # Filter by street_name (search in address1 with OR logic)
+    street_name = search_criteria.get("street_name")
+    if street_name:
+        address1_or_conditions.append('"address1"::text ILIKE %s')
+        params.append(f'%{street_name}%')
+    
+    # Filter by street_type (search in address1 with OR logic)
+    street_type = search_criteria.get("street_type")
+    if street_type:
+        address1_or_conditions.append('"address1"::text ILIKE %s')
+        params.append(f'%{street_type}%')
+    
+    # Build and execute query
+    # Combine: state AND city AND (address1 OR conditions)
+    where_parts = []
+    
+    # Add AND conditions (state, city)
+    if and_conditions:
+        where_parts.extend(and_conditions)
+    
+    # Add OR conditions for address1 (grouped with parentheses)
+    if address1_or_conditions:
+        if len(address1_or_conditions) > 1:
+            # Multiple address1 conditions - group them with OR
+            address1_clause = "(" + " OR ".join(address1_or_conditions) + ")"
+        else:
+            # Single address1 condition - no need for parentheses
+            address1_clause = address1_or_conditions[0]
+        where_parts.append(address1_clause)
+    
+    # Build final WHERE clause
+    # LIMIT is a parameter so every limit shares one prepared plan
+    if where_parts:
+        where_clause = " WHERE " + " AND ".join(where_parts)
+        query = f'SELECT {quoted_columns} FROM {quoted_table}{where_clause} LIMIT %s'
+    else:
+        # If no criteria, return a small sample
+        query = f'SELECT {quoted_columns} FROM {quoted_table} LIMIT %s'
+    params.append(int(limit))
+    
+    return query, params, target_columns
+
+
+def _parse_street_address(address1: Any) -> Optional[Tuple[str, str, str]]:
+    """
+    Split an address line into (street_number, street_name_full, street_name_core).
+
+    The core name has a trailing street type removed (e.g. "Village LN" -> "Village") so it can
+    match across different street types. Returns None when no leading street number is found.
+    """
+    # Typically address1 is in format like "123 Main St" or "456 Oak Avenue":
+    # a street number, whitespace, then the street name
+    parts = str(address1).strip().split(None, 1)
+    if len(parts) < 2 or not parts[0].isdigit():
+        return None
+    street_number, street_name_full = parts
+    
+    # Remove street type suffix from street name to allow matching across different types
+    # e.g., "Village LN" becomes "Village", which can match "Village Rd", "Village Lane", etc.
+    street_name_parts = street_name_full.strip().split()
+    if len(street_name_parts) > 1:
+        # Check if last word is a street type
+        last_word = street_name_parts[-1].lower().rstrip('.')
+        if last_word in _STREET_TYPES:
+            # Remove the street type suffix
+            street_name_core = ' '.join(street_name_parts[:-1])
+        else:
+            # No recognized street type, use full name
+            street_name_core = street_name_full
+    else:
+        # Only one word, use as-is
+        street_name_core = street_name_full
+    
+    return street_number, street_name_full, street_name_core
+
 
 class GoldenSourceConnector:
     """Handles connection to the golden source address database."""
     
+    # Table introspection results keyed by (db_type, schema_name, table_name).
+    # Schemas rarely change, so they are fetched once per process; see invalidate_schema_cache().
+    _SCHEMA_CACHE: Dict[Tuple[str, Optional[str], str], List[str]] = {}
+    _COLUMN_MAPPING_CACHE: Dict[Tuple[str, Optional[str], str], Tuple[Dict[str, Optional[str]], List[str]]] = {}
+    
+    # get_filtered_addresses results keyed by (canonical criteria, limit), in LRU order.
+    # Values are (expiry time, rows); see invalidate_query_cache().
+    _QUERY_CACHE: "OrderedDict[Tuple[Any, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+    _QUERY_CACHE_LOCK = threading.Lock()
+    
+    # In-memory copy of the Pinellas table keyed by (street number, upper-cased state);
+    # None until build_local_index() has run. See invalidate_local_index().
+    _LOCAL_INDEX: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None
+    _LOCAL_INDEX_COLUMNS: Optional[Tuple[str, str]] = None
+    
     def __init__(self):
         self.db_type = GOLDEN_SOURCE_DB_TYPE
         self.connection = None
+        self._pool = None
+        # A single SQLite connection is shared, so serialize access to it
+        self._sqlite_lock = threading.Lock()
         self._connect()
     
     def _connect(self):
-        """Establish connection to the database based on DB type."""
-        if self.db_type.lower() == "postgresql":
-            try:
-                import psycopg2
-            except ImportError:
-                raise ImportError("psycopg2 is required for PostgreSQL. Install with: pip install psycopg2-binary")
-            
-            # Validate that required credentials are provided
-            if not GOLDEN_SOURCE_HOST:
-                raise ValueError("GOLDEN_SOURCE_HOST environment variable is not set")
-            if not GOLDEN_SOURCE_DATABASE:
-                raise ValueError("GOLDEN_SOURCE_DATABASE environment variable is not set")
-            if not GOLDEN_SOURCE_USER:
-                raise ValueError("GOLDEN_SOURCE_USER environment variable is not set")
-            if not GOLDEN_SOURCE_PASSWORD:
-                raise ValueError("GOLDEN_SOURCE_PASSWORD environment variable is not set")
-            
-            try:
-                self.connection = psycopg2.connect(
-                    host=GOLDEN_SOURCE_HOST,
-                    port=GOLDEN_SOURCE_PORT,
-                    database=GOLDEN_SOURCE_DATABASE,
-                    user=GOLDEN_SOURCE_USER,
-                    password=GOLDEN_SOURCE_PASSWORD
-                )
-                # Enable autocommit mode for read-only queries to avoid transaction issues
-                self.connection.autocommit = True
-            except Exception as e:
-                error_msg = str(e)
-                error_type = type(e).__name__
-                
-                # Check if it's an OperationalError (connection/auth issues)
-                if error_type == "OperationalError" or "OperationalError" in str(type(e)):
-                    if "password authentication failed" in error_msg.lower():
-                        raise ValueError(
-                            f"PostgreSQL authentication failed for user '{GOLDEN_SOURCE_USER}'.\n"
-                            f"Connection details: host={GOLDEN_SOURCE_HOST}, port={GOLDEN_SOURCE_PORT}, database={GOLDEN_SOURCE_DATABASE}\n"
-                            f"Please verify:\n"
-                            f"  1. The password in GOLDEN_SOURCE_PASSWORD is correct\n"
-                            f"  2. The user '{GOLDEN_SOURCE_USER}' exists and has access to the database\n"
-                            f"  3. The database server allows connections from your IP address\n"
-                            f"  4. Check your .env file or environment variables\n"
-                            f"\nOriginal error: {error_msg}"
-                        )
-                    elif "could not connect" in error_msg.lower() or "connection refused" in error_msg.lower():
-                        raise ValueError(
-                            f"Could not connect to PostgreSQL server at {GOLDEN_SOURCE_HOST}:{GOLDEN_SOURCE_PORT}.\n"
-                            f"Please verify:\n"
-                            f"  1. The server is running and accessible\n"
-                            f"  2. The host and port are correct\n"
-                            f"  3. Your firewall allows connections to this server\n"
-                            f"\nOriginal error: {error_msg}"
-                        )
-                    else:
-                        raise ValueError(f"PostgreSQL connection error: {error_msg}")
-                else:
-                    raise ValueError(f"Failed to connect to PostgreSQL database: {error_msg}")
-        elif self.db_type.lower() == "mysql":
-            try:
-                import mysql.connector
-            except ImportError:
-                raise ImportError("mysql-connector-python is required for MySQL. Install with: pip install mysql-connector-python")
-            
-            # Validate that required credentials are provided
-            if not GOLDEN_SOURCE_HOST:
-                raise ValueError("GOLDEN_SOURCE_HOST environment variable is not set")
-            if not GOLDEN_SOURCE_DATABASE:
-                raise ValueError("GOLDEN_SOURCE_DATABASE environment variable is not set")
-            if not GOLDEN_SOURCE_USER:
-                raise ValueError("GOLDEN_SOURCE_USER environment variable is not set")
-            if not GOLDEN_SOURCE_PASSWORD:
-                raise ValueError("GOLDEN_SOURCE_PASSWORD environment variable is not set")
-            
+        """Set up database access based on DB type (a shared pool for PostgreSQL/MySQL)."""
+        global _INDEXES_ENSURED, _LOCAL_INDEX_REQUESTED
+        if self.db_type.lower() in ("postgresql", "mysql"):
+            self._pool = _get_pool(self.db_type.lower())
             try:
-                self.connection = mysql.connector.connect(
-                    host=GOLDEN_SOURCE_HOST,
-                    port=GOLDEN_SOURCE_PORT,
-                    database=GOLDEN_SOURCE_DATABASE,
-                    user=GOLDEN_SOURCE_USER,
-                    password=GOLDEN_SOURCE_PASSWORD
-                )
-            except mysql.connector.Error as e:
-                error_msg = str(e)
-                if "access denied" in error_msg.lower() or "authentication" in error_msg.lower():
-                    raise ValueError(
-                        f"MySQL authentication failed for user '{GOLDEN_SOURCE_USER}'.\n"
-                        f"Connection details: host={GOLDEN_SOURCE_HOST}, port={GOLDEN_SOURCE_PORT}, database={GOLDEN_SOURCE_DATABASE}\n"
-                        f"Please verify your credentials in the .env file or environment variables.\n"
-                        f"\nOriginal error: {error_msg}"
-                    )
-                else:
-                    raise ValueError(f"MySQL connection error: {error_msg}")
-            except Exception as e:
-                raise ValueError(f"Failed to connect to MySQL database: {e}")
+                if self.db_type.lower() == "postgresql":
+                    self._load_schema([GOLDEN_SOURCE_TABLE, PINELLAS_TABLE, _INTERNAL_UPDATES_TABLE])
+                if GOLDEN_SOURCE_CREATE_INDEXES and self.db_type.lower() == "postgresql" and not _INDEXES_ENSURED:
+                    _INDEXES_ENSURED = True
+                    self.create_search_indexes()
+                if GOLDEN_SOURCE_LOCAL_INDEX and not _LOCAL_INDEX_REQUESTED:
+                    _LOCAL_INDEX_REQUESTED = True
+                    self.build_local_index()
+            except Exception:
+                # The constructor fails, so nothing will call close() for this connector
+                _release_pool()
+                self._pool = None
+                raise
         elif self.db_type.lower() == "sqlite":
             try:
                 import sqlite3
-                self.connection = sqlite3.connect(GOLDEN_SOURCE_DATABASE)
+                self.connection = sqlite3.connect(GOLDEN_SOURCE_DATABASE, check_same_thread=False)
             except ImportError:
                 raise ImportError("sqlite3 should be included with Python")
         else:
             raise ValueError(f"Unsupported database type: {self.db_type}")
     
-    def get_all_addresses(self) -> List[Dict[str, Any]]:
-        """Retrieve all addresses from the golden source table."""
-        cursor = self.connection.cursor()
-        
-        # Parse schema and table name if schema-qualified
-        table_parts = GOLDEN_SOURCE_TABLE.split('.')
-        if len(table_parts) == 2:
-            schema_name, table_name = table_parts
+    @contextmanager
+    def _connection(self):
+        """Check out a database connection for the duration of one operation."""
+        db_type = self.db_type.lower()
+        if db_type == "postgresql":
+            with _pool_slot():
+                conn = self._pool.getconn()
+                try:
+                    # Enable autocommit mode for read-only queries to avoid transaction issues
+                    conn.autocommit = True
+                    yield conn
+                finally:
+                    # Drop broken connections instead of handing them out again
+                    self._pool.putconn(conn, close=bool(conn.closed))
+        elif db_type == "mysql":
+            with _pool_slot():
+                conn = self._pool.get_connection()
+                try:
+                    yield conn
+                finally:
+                    # Closing a pooled MySQL connection returns it to the pool
+                    conn.close()
         else:
-            schema_name = None
-            table_name = GOLDEN_SOURCE_TABLE
+            with self._sqlite_lock:
+                yield self.connection
+    
+    @classmethod
+    def invalidate_schema_cache(cls):
+        """Forget cached table columns and column mappings, e.g. after a table has been altered."""
+        cls._SCHEMA_CACHE.clear()
+        cls._COLUMN_MAPPING_CACHE.clear()
+    
+    @classmethod
+    def invalidate_local_index(cls):
+        """Drop the in-memory Pinellas index so lookups go back to SQL (rebuild with build_local_index())."""
+        cls._LOCAL_INDEX = None
+        cls._LOCAL_INDEX_COLUMNS = None
+    
+    @classmethod
+    def invalidate_query_cache(cls):
+        """Forget cached get_filtered_addresses results, e.g. after the golden source table has changed."""
+        with cls._QUERY_CACHE_LOCK:
+            cls._QUERY_CACHE.clear()
+    
+    def _load_schema(self, tables: List[str]):
+        """
+        Fill the table column cache for several (possibly schema-qualified) PostgreSQL tables
+        with a single information_schema query. Tables already cached are skipped; tables that
+        returned no columns (missing or not created yet) and query failures are left to the
+        per-table lookup in _get_table_columns.
+        """
+        wanted = {}
+        for qualified_table in tables:
+            table_parts = qualified_table.split('.')
+            schema_name = table_parts[0] if len(table_parts) == 2 else None
+            cache_key = (self.db_type.lower(), schema_name, table_parts[-1])
+            if cache_key not in self._SCHEMA_CACHE:
+                wanted[cache_key] = []
+        if not wanted:
+            return
+        
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute("""
+                        SELECT table_schema, table_name, column_name
+                        FROM information_schema.columns
+                        WHERE table_name = ANY(%s)
+                        ORDER BY table_schema, table_name, ordinal_position
+                    """, (sorted({table_name for _, _, table_name in wanted}),))
+                    rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+        except Exception as e:
+            logger.warning("⚠️  Warning: Could not load table schemas: %s", e)
+            return
         
-        # Try to get column names first
+        for table_schema, table_name, column_name in rows:
+            # Unqualified names match the table in any schema, like _get_table_columns
+            for cache_key in ((self.db_type.lower(), table_schema, table_name), (self.db_type.lower(), None, table_name)):
+                if cache_key in wanted:
+                    wanted[cache_key].append(column_name)
+        
+        self._SCHEMA_CACHE.update((cache_key, columns) for cache_key, columns in wanted.items() if columns)
+    
+    def _get_table_columns(self, cursor, schema_name: Optional[str], table_name: str) -> List[str]:
+        """Return the column names of a table in ordinal order (cached per process once the table exists)."""
+        cache_key = (self.db_type.lower(), schema_name, table_name)
+        columns = self._SCHEMA_CACHE.get(cache_key)
+        if columns is not None:
+            return columns
+        
+        full_table_name = f"{schema_name}.{table_name}" if schema_name else table_name
         if self.db_type.lower() == "postgresql":
             if schema_name:
                 # Handle schema-qualified table names
@@ -156,150 +578,345 @@ class GoldenSourceConnector:
                 """, (table_name,))
             columns = [row[0] for row in cursor.fetchall()]
         elif self.db_type.lower() == "mysql":
-            cursor.execute(f"DESCRIBE {GOLDEN_SOURCE_TABLE}")
+            cursor.execute(f"DESCRIBE {full_table_name}")
             columns = [row[0] for row in cursor.fetchall()]
         else:  # sqlite
-            cursor.execute(f"PRAGMA table_info({GOLDEN_SOURCE_TABLE})")
+            cursor.execute(f"PRAGMA table_info({full_table_name})")
             columns = [row[1] for row in cursor.fetchall()]
         
-        # Fetch all addresses - properly quote the table name
-        if schema_name:
-            # Use proper quoting for schema.table
-            quoted_table = f'"{schema_name}"."{table_name}"'
-        else:
-            quoted_table = f'"{table_name}"'
+        if columns:
+            # A missing table is looked up again next time, in case it has been created since
+            self._SCHEMA_CACHE[cache_key] = columns
+        return columns
+    
+    def create_search_indexes(self) -> List[str]:
+        """
+        Create the PostgreSQL indexes used by the address filters (if they don't already exist).
+        pg_trgm GIN indexes let Postgres answer the ILIKE '%...%' filters on address1, Mailing City
+        and the Pinellas address column with index scans instead of sequential scans,
+        text_pattern_ops btree indexes serve the anchored street-number LIKE prefixes, and
+        btree indexes serve the state equality filters. The golden source state index is a
+        covering (state, Mailing City) index that includes the remaining selected columns;
+        when one of the golden source indexes is newly built, the table is vacuumed so the
+        planner can use index-only scans.
         
-        cursor.execute(f'SELECT * FROM {quoted_table}')
-        rows = cursor.fetchall()
+        Returns:
+            Names of the indexes that exist after the call
+        """
+        if self.db_type.lower() != "postgresql":
+            logger.warning("⚠️  Warning: Search indexes are only supported for PostgreSQL")
+            return []
         
-        # Convert to list of dictionaries
-        addresses = []
-        for row in rows:
-            address_dict = {columns[i]: row[i] for i in range(len(columns))}
-            addresses.append(address_dict)
+        # (index name, statement, needs pg_trgm)
+        statements = [(None, 'CREATE EXTENSION IF NOT EXISTS pg_trgm', True)]
         
-        cursor.close()
-        return addresses
+        with self._connection() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                
+                # Golden source filters (get_filtered_addresses)
+                table_parts = GOLDEN_SOURCE_TABLE.split('.')
+                table_name = table_parts[-1]
+                quoted_table = '.'.join(f'"{part}"' for part in table_parts)
+                for column, suffix in (('address1', 'address1'), ('Mailing City', 'mailing_city')):
+                    index_name = f'{table_name}_{suffix}_trgm'
+                    statements.append((
+                        index_name,
+                        f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {quoted_table} USING gin ("{column}" gin_trgm_ops)',
+                        True
+                    ))
+                index_name = f'{table_name}_address1_prefix'
+                statements.append((
+                    index_name,
+                    f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {quoted_table} ("address1" text_pattern_ops)',
+                    False
+                ))
+                # Covers the state/city filter and carries the other selected columns,
+                # so get_filtered_addresses can be answered by an index-only scan
+                index_name = f'{table_name}_state_city_cover'
+                statements.append((
+                    index_name,
+                    f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {quoted_table} ("state", "Mailing City") '
+                    f'INCLUDE ("address1", "address2", "zipcode")',
+                    False
+                ))
+                golden_table = quoted_table
+                golden_indexes = {name for name, _, _ in statements if name}
+                
+                # Indexes already present, so the vacuum below only runs after a real build
+                cursor.execute(
+                    "SELECT indexname FROM pg_indexes WHERE tablename = %s AND schemaname = COALESCE(%s, current_schema())",
+                    (table_name, table_parts[0] if len(table_parts) == 2 else None)
+                )
+                existing_golden_indexes = {row[0] for row in cursor.fetchall()}
+                
+                # Pinellas street-number and street-name filters (get_pinellas_matches)
+                table_parts = PINELLAS_TABLE.split('.')
+                schema_name = table_parts[0] if len(table_parts) == 2 else None
+                table_name = table_parts[-1]
+                quoted_table = '.'.join(f'"{part}"' for part in table_parts)
+                column_mapping, pinellas_columns = self._get_pinellas_column_mapping(cursor, schema_name, table_name)
+                if column_mapping['address']:
+                    address_sql = _quote_column(column_mapping['address'], pinellas_columns)
+                    index_name = f'{table_name}_address_trgm'
+                    statements.append((
+                        index_name,
+                        f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {quoted_table} USING gin ({address_sql} gin_trgm_ops)',
+                        True
+                    ))
+                    index_name = f'{table_name}_address_prefix'
+                    statements.append((
+                        index_name,
+                        f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {quoted_table} ({address_sql} text_pattern_ops)',
+                        False
+                    ))
+                if column_mapping['state']:
+                    state_sql = _quote_column(column_mapping['state'], pinellas_columns)
+                    index_name = f'{table_name}_state_upper'
+                    statements.append((
+                        index_name,
+                        f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {quoted_table} (upper({state_sql}))',
+                        False
+                    ))
+                
+                # Index builds on large tables outlast the per-query timeout
+                cursor.execute('SET statement_timeout = 0')
+                
+                created = []
+                trgm_available = True
+                for index_name, statement, needs_trgm in statements:
+                    if needs_trgm and not trgm_available:
+                        continue
+                    try:
+                        cursor.execute(statement)
+                    except Exception as e:
+                        # Missing privileges etc. only cost performance, so keep going
+                        logger.warning("⚠️  Warning: Could not run '%s': %s", statement, e)
+                        if index_name is None:
+                            # Without the extension none of the trigram indexes can be built
+                            trgm_available = False
+                        continue
+                    if index_name:
+                        created.append(index_name)
+                
+                # Index-only scans need an up-to-date visibility map, so vacuum once after
+                # building a golden source index. VACUUM can't run inside a transaction,
+                # which is fine since pooled connections autocommit
+                if golden_indexes.intersection(created) - existing_golden_indexes:
+                    try:
+                        cursor.execute(f'VACUUM ANALYZE {golden_table}')
+                    except Exception as e:
+                        logger.warning("⚠️  Warning: Could not vacuum %s: %s", GOLDEN_SOURCE_TABLE, e)
+                
+                logger.info("✓ Search indexes ready: %s", ', '.join(created) if created else 'none')
+                return created
+            finally:
+                if cursor:
+                    if not connection.closed:
+                        # Back to the pool's session default
+                        cursor.execute('RESET statement_timeout')
+                    cursor.close()
     
-    def get_filtered_addresses(self, search_criteria: dict, limit: int = 100) -> List[Dict[str, Any]]:
+    def _execute(self, cursor, connection, query: str, params: List[Any]):
         """
-        Retrieve filtered addresses from the golden source table based on search criteria.
-        Only selects specific columns: address1, address2, Mailing City, state, zipcode
+        Execute a parameterized query, as a server-side prepared statement on PostgreSQL.
+        Each distinct query text is PREPAREd once per pooled connection and afterwards only
+        EXECUTEd, so Postgres skips parsing and planning on repeat calls.
+        """
+        if self.db_type.lower() != "postgresql":
+            cursor.execute(query, params)
+            return
         
-        Args:
-            search_criteria: Dictionary with search terms (street_number, street_name, city, state, zip_code, search_terms)
-            limit: Maximum number of addresses to return
-            
-        Returns:
-            List of address dictionaries with only the specified columns
+        import psycopg2.errors
+        
+        if GOLDEN_SOURCE_EXPLAIN:
+            # Debug aid: note that ANALYZE runs the query an extra time
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {query}', params)
+            logger.info("Query Plan:\n%s", "\n".join(row[0] for row in cursor.fetchall()))
+        
+        name = 'gs_' + hashlib.sha1(query.encode('utf-8')).hexdigest()[:16]
+        with _PREPARED_LOCK:
+            prepared = _PREPARED.setdefault(connection, set())
+        
+        if params:
+            execute_sql = f'EXECUTE {name} ({", ".join(["%s"] * len(params))})'
+        else:
+            execute_sql = f'EXECUTE {name}'
+        
+        for attempt in range(2):
+            if name not in prepared:
+                try:
+                    cursor.execute(f'PREPARE {name} AS {_to_numbered_placeholders(query)}')
+                except psycopg2.errors.DuplicatePreparedStatement:
+                    pass
+                prepared.add(name)
+            try:
+                cursor.execute(execute_sql, params)
+                return
+            except psycopg2.errors.InvalidSqlStatementName:
+                # The server dropped the statement (e.g. DISCARD ALL); prepare it again once
+                prepared.discard(name)
+                if attempt:
+                    raise
+    
+    def get_all_addresses(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all addresses from the golden source table.
+        Rows are fetched in batches (a server-side cursor on PostgreSQL) and yielded one at a time,
+        so the full table is never held in memory. The pooled connection stays checked out until
+        the iterator is exhausted or closed.
+        """
+        return self._iter_table_rows(GOLDEN_SOURCE_TABLE)
+    
+    def get_all_addresses_arrow(self):
         """
-        cursor = None
+        Fetch the whole golden source table as a pyarrow.Table (PostgreSQL, requires adbc-driver-postgresql).
+        The ADBC driver reads the table over the binary COPY protocol into columnar Arrow batches,
+        without building a Python object per row.
+        """
+        return self._fetch_table_arrow(GOLDEN_SOURCE_TABLE)
+    
+    def _fetch_table_arrow(self, qualified_table: str):
+        """Read a (possibly schema-qualified) table into a pyarrow.Table over a dedicated ADBC connection."""
+        if self.db_type.lower() != "postgresql":
+            raise ValueError("Arrow transfers are only supported for PostgreSQL")
         try:
-            cursor = self.connection.cursor()
+            import adbc_driver_postgresql.dbapi
+        except ImportError:
+            raise ImportError("adbc-driver-postgresql is required for Arrow transfers. Install with: pip install adbc-driver-postgresql pyarrow")
+        
+        _validate_credentials()
+        quoted_table = '.'.join(f'"{part}"' for part in qualified_table.split('.'))
+        with adbc_driver_postgresql.dbapi.connect(_postgres_uri()) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT * FROM {quoted_table}')
+                return cursor.fetch_arrow_table()
+    
+    def _iter_table_rows(self, qualified_table: str) -> Iterator[Dict[str, Any]]:
+        """Yield every row of a (possibly schema-qualified) table as a dictionary, in batches."""
+        with self._connection() as connection:
+            cursor = connection.cursor()
             
             # Parse schema and table name if schema-qualified
-            table_parts = GOLDEN_SOURCE_TABLE.split('.')
+            table_parts = qualified_table.split('.')
             if len(table_parts) == 2:
                 schema_name, table_name = table_parts
-                quoted_table = f'"{schema_name}"."{table_name}"'
             else:
                 schema_name = None
-                table_name = GOLDEN_SOURCE_TABLE
-                quoted_table = f'"{table_name}"'
+                table_name = qualified_table
             
-            # Define the specific columns we want to select
-            target_columns = ['address1', 'address2', 'Mailing City', 'state', 'zipcode']
-            quoted_columns = ', '.join([f'"{col}"' for col in target_columns])
-            
-            # Build WHERE clause based on search criteria
-            # Logic: state AND city AND street_number AND (street_name OR street_type in address1)
-            # State, City, and Street Number use AND logic (must match)
-            # Address1 searches (street_name, street_type) use OR logic
-            
-            params = []
-            and_conditions = []
-            address1_or_conditions = []
-            
-            # Filter by state (REQUIRED with AND logic)
-            state = search_criteria.get("state")
-            if state:
-                and_conditions.append('"state"::text ILIKE %s')
-                params.append(f'%{state}%')
-            
-            # Filter by city (REQUIRED with AND logic)
-            city = search_criteria.get("city")
-            if city:
-                and_conditions.append('"Mailing City"::text ILIKE %s')
-                params.append(f'%{city}%')
-            
-            # Filter by street_number (REQUIRED with AND logic - must match start of address1)
-            street_number = search_criteria.get("street_number")
-            if street_number:
-                and_conditions.append('"address1"::text ILIKE %s')
-                params.append(f'{street_number}%')
-            
-            # Filter by street_name (search in address1 with OR logic)
-            street_name = search_criteria.get("street_name")
-            if street_name:
-                address1_or_conditions.append('"address1"::text ILIKE %s')
-                params.append(f'%{street_name}%')
-            
-            # Filter by street_type (search in address1 with OR logic)
-            street_type = search_criteria.get("street_type")
-            if street_type:
-                address1_or_conditions.append('"address1"::text ILIKE %s')
-                params.append(f'%{street_type}%')
-            
-            # Build and execute query
-            # Combine: state AND city AND (address1 OR conditions)
-            where_parts = []
-            
-            # Add AND conditions (state, city)
-            if and_conditions:
-                where_parts.extend(and_conditions)
-            
-            # Add OR conditions for address1 (grouped with parentheses)
-            if address1_or_conditions:
-                if len(address1_or_conditions) > 1:
-                    # Multiple address1 conditions - group them with OR
-                    address1_clause = "(" + " OR ".join(address1_or_conditions) + ")"
-                else:
-                    # Single address1 condition - no need for parentheses
-                    address1_clause = address1_or_conditions[0]
-                where_parts.append(address1_clause)
-            
-            # Build final WHERE clause
-            if where_parts:
-                where_clause = " WHERE " + " AND ".join(where_parts)
-                query = f'SELECT {quoted_columns} FROM {quoted_table}{where_clause} LIMIT {limit}'
+            # Get column names first
+            columns = self._get_table_columns(cursor, schema_name, table_name)
+            
+            # Fetch all rows - properly quote the table name
+            if schema_name:
+                # Use proper quoting for schema.table
+                quoted_table = f'"{schema_name}"."{table_name}"'
             else:
-                # If no criteria, return a small sample
-                query = f'SELECT {quoted_columns} FROM {quoted_table} LIMIT {limit}'
+                quoted_table = f'"{table_name}"'
             
-            # Log the query for debugging
-            print(f"\nDatabase Query Generated:")
-            print(f"Query: {query}")
-            print(f"Params: {params}")
-            print("-" * 60)
+            if self.db_type.lower() == "postgresql":
+                # Named (server-side) cursors only exist inside a transaction
+                connection.autocommit = False
+                # Full-table reads are expected to outlast the per-query timeout
+                cursor.execute('SET LOCAL statement_timeout = 0')
+                cursor.close()
+                cursor = connection.cursor(name='gs_stream')
+                cursor.itersize = _STREAM_BATCH_SIZE
             
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            try:
+                cursor.execute(f'SELECT * FROM {quoted_table}')
+                while True:
+                    rows = cursor.fetchmany(_STREAM_BATCH_SIZE)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(zip(columns, row))
+            finally:
+                cursor.close()
+                if self.db_type.lower() == "postgresql" and not connection.closed:
+                    # Read-only transaction; end it and restore autocommit before returning to the pool
+                    connection.rollback()
+                    connection.autocommit = True
+    
+    def get_filtered_addresses(self, search_criteria: dict, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retrieve filtered addresses from the golden source table based on search criteria.
+        Only selects specific columns: address1, address2, Mailing City, state, zipcode
+        
+        Args:
+            search_criteria: Dictionary with search terms (street_number, street_name, city, state, zip_code, search_terms)
+            limit: Maximum number of addresses to return
             
-            # Convert to list of dictionaries using the target columns
-            addresses = []
-            for row in rows:
-                address_dict = {target_columns[i]: row[i] for i in range(len(target_columns))}
-                addresses.append(address_dict)
+        Returns:
+            List of address dictionaries with only the specified columns
             
-            return addresses
+        Raises:
+            QueryTimeoutError: If the statement timeout cancelled the query
+        """
+        canonical = _canonical_criteria(search_criteria)
+        if GOLDEN_SOURCE_QUERY_CACHE_SIZE <= 0 or GOLDEN_SOURCE_QUERY_CACHE_TTL <= 0:
+            return self._query_filtered_addresses(dict(canonical), limit)
+        
+        cache_key = (canonical, limit)
+        now = time.monotonic()
+        with self._QUERY_CACHE_LOCK:
+            cached = self._QUERY_CACHE.get(cache_key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._QUERY_CACHE.move_to_end(cache_key)
+                else:
+                    del self._QUERY_CACHE[cache_key]
+                    cached = None
+        if cached is not None:
+            # Copies, so callers can't modify the cached rows
+            return [dict(address) for address in cached[1]]
+        
+        # A QueryTimeoutError propagates before caching, so a later call can try again
+        addresses = self._query_filtered_addresses(dict(canonical), limit)
+        
+        with self._QUERY_CACHE_LOCK:
+            self._QUERY_CACHE[cache_key] = (now + GOLDEN_SOURCE_QUERY_CACHE_TTL, [dict(address) for address in addresses])
+            self._QUERY_CACHE.move_to_end(cache_key)
+            while len(self._QUERY_CACHE) > GOLDEN_SOURCE_QUERY_CACHE_SIZE:
+                self._QUERY_CACHE.popitem(last=False)
+        return addresses
+    
+    def _query_filtered_addresses(self, search_criteria: dict, limit: int) -> List[Dict[str, Any]]:
+        """
+        Run the golden source filter query for get_filtered_addresses (uncached).
+        Raises QueryTimeoutError if the query was cancelled by the statement timeout.
+        """
+        with self._connection() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                
+                query, params, target_columns = _build_filtered_query(search_criteria, limit)
+                
+                # Log the query for debugging
+                logger.debug("Database Query Generated:\nQuery: %s\nParams: %s", query, params)
+                
+                self._execute(cursor, connection, query, params)
+                rows = cursor.fetchall()
+                
+                # Convert to list of dictionaries using the target columns
+                addresses = [dict(zip(target_columns, row)) for row in rows]
+                
+                return addresses
             
-        except Exception as e:
-            # With autocommit enabled, we don't need rollback, but log the error
-            error_msg = str(e)
-            raise ValueError(f"Database query error: {error_msg}")
-        finally:
-            if cursor:
-                cursor.close()
+            except Exception as e:
+                if getattr(e, 'pgcode', None) == _PG_QUERY_CANCELED:
+                    # Non-selective criteria ran into statement_timeout
+                    logger.warning("⚠️  Warning: Golden source query cancelled after %d ms", GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS)
+                    raise QueryTimeoutError(f"Golden source query cancelled after {GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS} ms")
+                # With autocommit enabled, we don't need rollback, but log the error
+                error_msg = str(e)
+                raise ValueError(f"Database query error: {error_msg}")
+            finally:
+                if cursor:
+                    cursor.close()
     
     def _get_pinellas_column_mapping(self, cursor, schema_name: Optional[str], table_name: str) -> Tuple[Dict[str, Optional[str]], List[str]]:
         """
@@ -308,30 +925,16 @@ class GoldenSourceConnector:
         Returns a tuple of:
         - Dictionary with keys: 'address', 'city', 'state', 'zip' (mapped to actual column names)
         - List of all column names in the table (in order)
+        
+        The result is cached per process; see invalidate_schema_cache().
         """
+        cache_key = (self.db_type.lower(), schema_name, table_name)
+        cached = self._COLUMN_MAPPING_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Get all column names from the Pinellas table
-        if self.db_type.lower() == "postgresql":
-            if schema_name:
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                """, (schema_name, table_name))
-            else:
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = %s
-                    ORDER BY ordinal_position
-                """, (table_name,))
-            columns = [row[0] for row in cursor.fetchall()]
-        elif self.db_type.lower() == "mysql":
-            cursor.execute(f"DESCRIBE {PINELLAS_TABLE}")
-            columns = [row[0] for row in cursor.fetchall()]
-        else:  # sqlite
-            cursor.execute(f"PRAGMA table_info({PINELLAS_TABLE})")
-            columns = [row[1] for row in cursor.fetchall()]
+        columns = self._get_table_columns(cursor, schema_name, table_name)
         
         # Convert to lowercase for case-insensitive matching
         columns_lower = {col.lower(): col for col in columns}
@@ -385,16 +988,105 @@ class GoldenSourceConnector:
             if mapping['zip']:
                 break
         
-        print(f"\n[Pinellas Table Column Mapping]")
-        print(f"  Available columns: {', '.join(columns)}")
-        print(f"  Mapped columns:")
-        print(f"    - Address field: {mapping['address']}")
-        print(f"    - City field: {mapping['city']}")
-        print(f"    - State field: {mapping['state']}")
-        print(f"    - Zip field: {mapping['zip']}")
+        logger.debug("Pinellas Table Column Mapping:\n  Available columns: %s\n  Address field: %s\n"
+                     "  City field: %s\n  State field: %s\n  Zip field: %s",
+                     ', '.join(columns), mapping['address'], mapping['city'], mapping['state'], mapping['zip'])
         
+        if columns:
+            self._COLUMN_MAPPING_CACHE[cache_key] = (mapping, columns)
         return mapping, columns
     
+    def build_local_index(self, use_arrow: bool = True) -> int:
+        """
+        Load the Pinellas table into memory so get_pinellas_matches can skip the database.
+        Rows are streamed once and grouped by (street number, state); the street name check is
+        then a substring test over the few rows sharing a number and state.
+        
+        Args:
+            use_arrow: Load the table as Arrow batches when adbc-driver-postgresql is installed
+                (values then follow Arrow's type mapping rather than psycopg2's)
+        
+        Returns:
+            Number of Pinellas rows indexed (0 if the table could not be indexed)
+        """
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    table_parts = PINELLAS_TABLE.split('.')
+                    schema_name = table_parts[0] if len(table_parts) == 2 else None
+                    column_mapping, _ = self._get_pinellas_column_mapping(cursor, schema_name, table_parts[-1])
+                finally:
+                    cursor.close()
+            
+            address_col = column_mapping['address']
+            state_col = column_mapping['state']
+            if not address_col or not state_col:
+                logger.warning("⚠️  Warning: Could not identify address/state columns in Pinellas table")
+                return 0
+            
+            rows = None
+            if use_arrow and self.db_type.lower() == "postgresql":
+                try:
+                    table = self._fetch_table_arrow(PINELLAS_TABLE)
+                    rows = (row for batch in table.to_batches(max_chunksize=_STREAM_BATCH_SIZE) for row in batch.to_pylist())
+                except ImportError:
+                    pass
+                except Exception as e:
+                    logger.warning("⚠️  Warning: Arrow load failed, streaming rows instead: %s", e)
+            if rows is None:
+                rows = self._iter_table_rows(PINELLAS_TABLE)
+            
+            index: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+            count = 0
+            for row in rows:
+                address = row.get(address_col)
+                state = row.get(state_col)
+                if address is None or state is None:
+                    continue
+                # LIKE '<number> %' matches exactly the text before the first space
+                address = str(address)
+                if ' ' not in address:
+                    continue
+                street_number = address.split(' ', 1)[0]
+                index.setdefault((street_number, str(state).upper()), []).append(row)
+                count += 1
+        except Exception as e:
+            logger.warning("⚠️  Warning: Could not build local Pinellas index: %s", e)
+            return 0
+        
+        type(self)._LOCAL_INDEX_COLUMNS = (address_col, state_col)
+        type(self)._LOCAL_INDEX = index
+        logger.info("✓ Local Pinellas index built: %d row(s)", count)
+        return count
+    
+    def _local_index_matches(self, golden_address: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Answer a get_pinellas_matches lookup from the local index.
+        Returns None when no index has been built, so the caller queries the database.
+        """
+        index = self._LOCAL_INDEX
+        columns = self._LOCAL_INDEX_COLUMNS
+        if index is None or columns is None:
+            return None
+        
+        address1 = golden_address.get('address1', '')
+        state = golden_address.get('state', '')
+        if not address1 or not state:
+            return []
+        
+        parsed = _parse_street_address(address1)
+        if not parsed:
+            return []
+        street_number, _, street_name_core = parsed
+        
+        address_col = columns[0]
+        name_lower = street_name_core.lower()
+        return [
+            dict(row) for row in index.get((street_number, str(state).upper()), ())
+            if name_lower in str(row[address_col]).lower()
+        ]
+    
     def get_pinellas_matches(self, golden_address: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Query pinellas_fl_baddatascenarios table to find addresses matching the golden source address.
@@ -406,148 +1098,304 @@ class GoldenSourceConnector:
             
         Returns:
             List of matching addresses from pinellas_fl_baddatascenarios table
-        """
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
             
-            # Parse schema and table name if schema-qualified
-            table_parts = PINELLAS_TABLE.split('.')
-            if len(table_parts) == 2:
-                schema_name, table_name = table_parts
-                quoted_table = f'"{schema_name}"."{table_name}"'
-            else:
-                schema_name = None
-                table_name = PINELLAS_TABLE
-                quoted_table = f'"{table_name}"'
-            
-            # Discover the column mapping for the Pinellas table
-            column_mapping, all_columns = self._get_pinellas_column_mapping(cursor, schema_name, table_name)
+        Raises:
+            QueryTimeoutError: If the statement timeout cancelled the query
+        """
+        local_matches = self._local_index_matches(golden_address)
+        if local_matches is not None:
+            logger.info("✓ Found %d matching address(es) in Pinellas table (local index)", len(local_matches))
+            return local_matches
+        
+        with self._connection() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                
+                # Parse schema and table name if schema-qualified
+                table_parts = PINELLAS_TABLE.split('.')
+                if len(table_parts) == 2:
+                    schema_name, table_name = table_parts
+                    quoted_table = f'"{schema_name}"."{table_name}"'
+                else:
+                    schema_name = None
+                    table_name = PINELLAS_TABLE
+                    quoted_table = f'"{table_name}"'
+                
+                # Discover the column mapping for the Pinellas table
+                column_mapping, all_columns = self._get_pinellas_column_mapping(cursor, schema_name, table_name)
+                
+                # Check if we found the required columns
+                if not column_mapping['address']:
+                    logger.warning("⚠️  Warning: Could not identify address column in Pinellas table")
+                    return []
+                if not column_mapping['state']:
+                    logger.warning("⚠️  Warning: Could not identify state column in Pinellas table")
+                    return []
+                
+                # Extract street number, street name, and state from golden address
+                # The golden_address typically has fields like: address1, address2, Mailing City, state, zipcode
+                address1 = golden_address.get('address1', '')
+                state = golden_address.get('state', '')
+                
+                if not address1 or not state:
+                    return []
+                
+                parsed = _parse_street_address(address1)
+                if not parsed:
+                    # Can't extract street number, return empty
+                    return []
+                street_number, street_name_full, street_name_core = parsed
+                
+                logger.debug("Pinellas Match Debug:\n  Original address1: %s\n  Extracted street number: %s\n"
+                             "  Full street name: %s\n  Core street name (without type): %s\n  State: %s",
+                             address1, street_number, street_name_full, street_name_core, state)
+                
+                # Build WHERE clause to match street number, street name, and state
+                # Use the discovered column names from the mapping
+                where_conditions = []
+                params = []
+                
+                # Get the actual column names to use
+                address_col = column_mapping['address']
+                state_col = column_mapping['state']
+                address_sql = _quote_column(address_col, all_columns)
+                state_sql = _quote_column(state_col, all_columns)
+                
+                # Match EXACT street number in address column - must match exactly, not partially
+                # Anchored LIKE on "<number> " so a text_pattern_ops index can be used
+                where_conditions.append(f'{address_sql}::text LIKE %s')
+                params.append(f'{_escape_like(street_number)} %')
+                
+                # Match core street name in address column (without street type for flexibility)
+                where_conditions.append(f'{address_sql}::text ILIKE %s')
+                params.append(f'%{_escape_like(street_name_core)}%')
+                
+                # Match state case-insensitively (Pinellas data has mixed-case states);
+                # upper() equality can use the upper("state") expression index
+                where_conditions.append(f'upper({state_sql}) = %s')
+                params.append(str(state).upper())
+                
+                # Combine with AND logic (all conditions must match)
+                where_clause = " WHERE " + " AND ".join(where_conditions)
+                
+                # Execute query - select all columns
+                query = f'SELECT * FROM {quoted_table}{where_clause}'
+                
+                # Log the query for debugging
+                logger.debug("Pinellas Query Generated:\nQuery: %s\nParams: %s", query, params)
+                
+                self._execute(cursor, connection, query, params)
+                rows = cursor.fetchall()
+                
+                # Convert to list of dictionaries using the column names we already discovered
+                matches = [dict(zip(all_columns, row)) for row in rows]
+                
+                logger.info("✓ Found %d matching address(es) in Pinellas table", len(matches))
+                
+                return matches
             
-            # Check if we found the required columns
-            if not column_mapping['address']:
-                print("  ⚠️  Warning: Could not identify address column in Pinellas table")
-                return []
-            if not column_mapping['state']:
-                print("  ⚠️  Warning: Could not identify state column in Pinellas table")
+            except Exception as e:
+                if getattr(e, 'pgcode', None) == _PG_QUERY_CANCELED:
+                    # Not the same as "no internal match" - callers must not offer to insert the address
+                    logger.warning("⚠️  Warning: Pinellas query cancelled after %d ms", GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS)
+                    raise QueryTimeoutError(f"Pinellas query cancelled after {GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS} ms")
+                error_msg = str(e)
+                logger.error("Error querying Pinellas table: %s", error_msg)
+                # Return empty list instead of raising error to avoid breaking the main flow
                 return []
+            finally:
+                if cursor:
+                    cursor.close()
+    
+    def get_pinellas_matches_batch(self, golden_addresses: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Find Pinellas matches for several golden source addresses in a single query.
+        Uses the same match criteria as get_pinellas_matches, joining the Pinellas table against
+        a VALUES list of pre-parsed (street number, core street name, state) rows.
+        
+        Args:
+            golden_addresses: Matched addresses from golden_source table
             
-            # Extract street number, street name, and state from golden address
-            # The golden_address typically has fields like: address1, address2, Mailing City, state, zipcode
+        Returns:
+            One list of matching Pinellas addresses per input address, in input order
+        """
+        results: List[List[Dict[str, Any]]] = [[] for _ in golden_addresses]
+        if not golden_addresses:
+            return results
+        
+        if self.db_type.lower() != "postgresql" or self._LOCAL_INDEX is not None:
+            # execute_values is PostgreSQL-specific, and with a local index single lookups skip SQL
+            return [self.get_pinellas_matches(address) for address in golden_addresses]
+        
+        # Pre-parse every address; unparseable ones simply get no matches
+        values = []
+        for idx, golden_address in enumerate(golden_addresses):
             address1 = golden_address.get('address1', '')
             state = golden_address.get('state', '')
-            
             if not address1 or not state:
-                return []
-            
-            # Extract street number and street name from address1
-            # Typically address1 is in format like "123 Main St" or "456 Oak Avenue"
-            import re
-            
-            # Common street type suffixes (abbreviations and full names)
-            street_types = [
-                'street', 'st', 'avenue', 'ave', 'road', 'rd', 'drive', 'dr',
-                'lane', 'ln', 'court', 'ct', 'circle', 'cir', 'boulevard', 'blvd',
-                'way', 'place', 'pl', 'terrace', 'ter', 'parkway', 'pkwy',
-                'highway', 'hwy', 'trail', 'trl', 'plaza', 'plz', 'alley', 'aly',
-                'loop', 'square', 'sq', 'crossing', 'xing', 'run', 'point', 'pt',
-                'pike', 'row', 'path', 'walk', 'commons', 'green', 'crescent', 'cres'
-            ]
-            
-            # Match pattern: street number at the start, followed by street name
-            match = re.match(r'^(\d+)\s+(.+)$', str(address1).strip())
-            
-            if not match:
-                # If no clear street number pattern, try to extract any number
-                parts = str(address1).strip().split(None, 1)
-                if len(parts) >= 2 and parts[0].isdigit():
-                    street_number = parts[0]
-                    street_name_full = parts[1]
-                else:
-                    # Can't extract street number, return empty
-                    return []
-            else:
-                street_number = match.group(1)
-                street_name_full = match.group(2)
-            
-            # Remove street type suffix from street name to allow matching across different types
-            # e.g., "Village LN" becomes "Village", which can match "Village Rd", "Village Lane", etc.
-            street_name_parts = street_name_full.strip().split()
-            if len(street_name_parts) > 1:
-                # Check if last word is a street type
-                last_word = street_name_parts[-1].lower().rstrip('.')
-                if last_word in street_types:
-                    # Remove the street type suffix
-                    street_name_core = ' '.join(street_name_parts[:-1])
+                continue
+            parsed = _parse_street_address(address1)
+            if not parsed:
+                continue
+            street_number, _, street_name_core = parsed
+            values.append((idx, f'{_escape_like(street_number)} %', f'%{_escape_like(street_name_core)}%', str(state).upper()))
+        
+        if not values:
+            return results
+        
+        with self._connection() as connection:
+            cursor = None
+            try:
+                from psycopg2.extras import execute_values
+                
+                cursor = connection.cursor()
+                
+                # Parse schema and table name if schema-qualified
+                table_parts = PINELLAS_TABLE.split('.')
+                if len(table_parts) == 2:
+                    schema_name, table_name = table_parts
+                    quoted_table = f'"{schema_name}"."{table_name}"'
                 else:
-                    # No recognized street type, use full name
-                    street_name_core = street_name_full
-            else:
-                # Only one word, use as-is
-                street_name_core = street_name_full
-            
-            print(f"\n[Pinellas Match Debug]")
-            print(f"  Original address1: {address1}")
-            print(f"  Extracted street number: {street_number}")
-            print(f"  Full street name: {street_name_full}")
-            print(f"  Core street name (without type): {street_name_core}")
-            print(f"  State: {state}")
-            
-            # Build WHERE clause to match street number, street name, and state
-            # Use the discovered column names from the mapping
-            where_conditions = []
-            params = []
-            
-            # Get the actual column names to use
-            address_col = column_mapping['address']
-            state_col = column_mapping['state']
-            
-            # Match EXACT street number in address column - must match exactly, not partially
-            # Use regex to match street number followed by space or end of string
-            where_conditions.append(f'"{address_col}"::text ~* %s')
-            params.append(f'^{street_number}\\s')
-            
-            # Match core street name in address column (without street type for flexibility)
-            where_conditions.append(f'"{address_col}"::text ILIKE %s')
-            params.append(f'%{street_name_core}%')
-            
-            # Match state
-            where_conditions.append(f'"{state_col}"::text ILIKE %s')
-            params.append(state)
-            
-            # Combine with AND logic (all conditions must match)
-            where_clause = " WHERE " + " AND ".join(where_conditions)
-            
-            # Execute query - select all columns
-            query = f'SELECT * FROM {quoted_table}{where_clause}'
-            
-            # Log the query for debugging
-            print(f"\nPinellas Query Generated:")
-            print(f"Query: {query}")
-            print(f"Params: {params}")
-            print("-" * 60)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # Convert to list of dictionaries using the column names we already discovered
-            matches = []
-            for row in rows:
-                match_dict = {all_columns[i]: row[i] for i in range(len(all_columns))}
-                matches.append(match_dict)
+                    schema_name = None
+                    table_name = PINELLAS_TABLE
+                    quoted_table = f'"{table_name}"'
+                
+                column_mapping, all_columns = self._get_pinellas_column_mapping(cursor, schema_name, table_name)
+                if not column_mapping['address'] or not column_mapping['state']:
+                    logger.warning("⚠️  Warning: Could not identify address/state columns in Pinellas table")
+                    return results
+                
+                address_col = column_mapping['address']
+                state_col = column_mapping['state']
+                address_sql = _quote_column(address_col, all_columns)
+                state_sql = _quote_column(state_col, all_columns)
+                
+                # Same conditions as get_pinellas_matches, with the patterns supplied per VALUES row
+                query = (
+                    f'SELECT v.idx, p.* FROM (VALUES %s) AS v(idx, num_pattern, name_pattern, state) '
+                    f'JOIN {quoted_table} p '
+                    f'ON p.{address_sql}::text LIKE v.num_pattern '
+                    f'AND p.{address_sql}::text ILIKE v.name_pattern '
+                    f'AND upper(p.{state_sql}) = v.state'
+                )
+                
+                rows = execute_values(
+                    cursor, query, values,
+                    template="(%s, %s, %s, %s)", page_size=len(values), fetch=True
+                )
+                
+                # First column is the VALUES index; the rest are the Pinellas columns
+                for row in rows:
+                    results[row[0]].append(dict(zip(all_columns, row[1:])))
+                
+                logger.info("✓ Found %d matching address(es) in Pinellas table for %d input(s)", len(rows), len(values))
+                
+                return results
             
-            print(f"  ✓ Found {len(matches)} matching address(es) in Pinellas table")
+            except Exception as e:
+                if getattr(e, 'pgcode', None) == _PG_QUERY_CANCELED:
+                    # Not the same as "no internal match" - callers must not offer to insert the address
+                    logger.warning("⚠️  Warning: Pinellas query cancelled after %d ms", GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS)
+                    raise QueryTimeoutError(f"Pinellas query cancelled after {GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS} ms")
+                error_msg = str(e)
+                logger.error("Error querying Pinellas table: %s", error_msg)
+                # Return empty lists instead of raising error to avoid breaking the main flow
+                return [[] for _ in golden_addresses]
+            finally:
+                if cursor:
+                    cursor.close()
+    
+    def get_golden_with_pinellas(self, search_criteria: dict, limit: int = 100) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Run get_filtered_addresses and the Pinellas lookup for every candidate in one query.
+        The golden source filter becomes a CTE; street number and core street name are parsed
+        in SQL the same way as _parse_street_address, and the Pinellas table is LEFT JOINed
+        with the get_pinellas_matches criteria.
+        
+        Args:
+            search_criteria: Dictionary with search terms (street_number, street_name, city, state, street_type)
+            limit: Maximum number of golden source addresses to return
             
-            return matches
+        Returns:
+            List of (golden source address, matching Pinellas addresses) tuples
+        """
+        if self.db_type.lower() != "postgresql" or self._LOCAL_INDEX is not None:
+            # The fused query is PostgreSQL-specific; with a local index the lookups skip SQL anyway
+            addresses = self.get_filtered_addresses(search_criteria, limit)
+            return list(zip(addresses, self.get_pinellas_matches_batch(addresses)))
+        
+        with self._connection() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                
+                table_parts = PINELLAS_TABLE.split('.')
+                schema_name = table_parts[0] if len(table_parts) == 2 else None
+                quoted_table = '.'.join(f'"{part}"' for part in table_parts)
+                column_mapping, all_columns = self._get_pinellas_column_mapping(cursor, schema_name, table_parts[-1])
+                if not column_mapping['address'] or not column_mapping['state']:
+                    raise ValueError("Could not identify address/state columns in Pinellas table")
+                address_col = column_mapping['address']
+                state_col = column_mapping['state']
+                address_sql = _quote_column(address_col, all_columns)
+                state_sql = _quote_column(state_col, all_columns)
+                
+                golden_query, params, target_columns = _build_filtered_query(dict(_canonical_criteria(search_criteria)), limit)
+                golden_columns = ', '.join(f'c."{col}"' for col in target_columns)
+                
+                query = (
+                    f'WITH g AS ({golden_query}), '
+                    # Street number and full street name (the _parse_street_address split)
+                    f'n AS (SELECT g.*, row_number() OVER () AS g_idx, '
+                    rf"""regexp_match(btrim(g."address1"::text), '^(\d+)\s+(.+)$') AS num_name FROM g), """
+                    # Last word of the street name, to strip a trailing street type
+                    rf"s AS (SELECT n.*, regexp_match(btrim(n.num_name[2]), '^(.*\S)\s+(\S+)$') AS name_type FROM n), "
+                    f'c AS (SELECT s.*, CASE WHEN lower(rtrim(s.name_type[2], \'.\')) = ANY(%s) '
+                    rf"THEN regexp_replace(s.name_type[1], '\s+', ' ', 'g') ELSE btrim(s.num_name[2]) END AS name_core FROM s) "
+                    f'SELECT {golden_columns}, c.g_idx, p.* FROM c '
+                    f'LEFT JOIN {quoted_table} p '
+                    f'ON c.num_name IS NOT NULL '
+                    f'AND p.{address_sql}::text LIKE c.num_name[1] || \' %%\' '
+                    f'AND p.{address_sql}::text ILIKE \'%%\' || '
+                    f"replace(replace(replace(c.name_core, '\\', '\\\\'), '%%', '\\%%'), '_', '\\_') || '%%' "
+                    f'AND upper(p.{state_sql}) = upper(c."state"::text) '
+                    f'ORDER BY c.g_idx'
+                )
+                params.append(sorted(_STREET_TYPES))
+                
+                # Log the query for debugging
+                logger.debug("Fused Golden/Pinellas Query Generated:\nQuery: %s\nParams: %s", query, params)
+                
+                self._execute(cursor, connection, query, params)
+                rows = cursor.fetchall()
+                
+                # One row per (golden address, Pinellas match); LEFT JOIN rows without a match have a NULL address
+                results: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = []
+                golden_count = len(target_columns)
+                address_pos = golden_count + 1 + all_columns.index(address_col)
+                last_idx = None
+                for row in rows:
+                    if row[golden_count] != last_idx:
+                        last_idx = row[golden_count]
+                        results.append((dict(zip(target_columns, row[:golden_count])), []))
+                    if row[address_pos] is not None:
+                        results[-1][1].append(dict(zip(all_columns, row[golden_count + 1:])))
+                
+                logger.info("✓ Found %d golden source address(es) with %d Pinellas match(es)",
+                            len(results), sum(len(matches) for _, matches in results))
+                
+                return results
             
-        except Exception as e:
-            error_msg = str(e)
-            print(f"Error querying Pinellas table: {error_msg}")
-            # Return empty list instead of raising error to avoid breaking the main flow
-            return []
-        finally:
-            if cursor:
-                cursor.close()
+            except Exception as e:
+                if getattr(e, 'pgcode', None) == _PG_QUERY_CANCELED:
+                    logger.warning("⚠️  Warning: Golden source query cancelled after %d ms", GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS)
+                    raise QueryTimeoutError(f"Golden source query cancelled after {GOLDEN_SOURCE_STATEMENT_TIMEOUT_MS} ms")
+                error_msg = str(e)
+                raise ValueError(f"Database query error: {error_msg}")
+            finally:
+                if cursor:
+                    cursor.close()
     
     def consolidate_pinellas_records(self, pinellas_matches: List[Dict[str, Any]], golden_source_address: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -577,7 +1425,7 @@ class GoldenSourceConnector:
             
             # Apply Golden Source address even for single record
             if golden_source_address:
-                print(f"\n[Single Record - Applying Golden Source Address]")
+                logger.debug("Single Record - Applying Golden Source Address")
                 
                 golden_address_fields = {
                     'address1': golden_source_address.get('address1'),
@@ -624,21 +1472,21 @@ class GoldenSourceConnector:
                         if matching_col:
                             old_value = consolidated_record[matching_col]
                             consolidated_record[matching_col] = field_value
-                            print(f"  Updated {matching_col}: '{old_value}' -> '{field_value}'")
+                            logger.debug("Updated %s: '%s' -> '%s'", matching_col, old_value, field_value)
                         else:
                             # Don't add new columns - only update existing ones
-                            print(f"  ⚠️  Warning: No matching column found for '{field_name}' (value: '{field_value}') - skipping")
-                            print(f"     Available columns: {list(consolidated_record.keys())}")
+                            logger.warning("⚠️  Warning: No matching column found for '%s' (value: '%s') - skipping. "
+                                           "Available columns: %s", field_name, field_value, list(consolidated_record.keys()))
                 
                 # Update city field
                 if city_value and city_col:
                     old_city = consolidated_record[city_col]
                     consolidated_record[city_col] = city_value
-                    print(f"  Updated {city_col}: '{old_city}' -> '{city_value}'")
+                    logger.debug("Updated %s: '%s' -> '%s'", city_col, old_city, city_value)
                 elif city_value:
-                    print(f"  ⚠️  Warning: No matching city column found (value: '{city_value}') - skipping")
+                    logger.warning("⚠️  Warning: No matching city column found (value: '%s') - skipping", city_value)
                 
-                print(f"  ✓ Applied Golden Source address to single record")
+                logger.info("✓ Applied Golden Source address to single record")
             
             return {"status": "success", "consolidated_record": consolidated_record, "message": "Single record, no consolidation needed"}
         
@@ -668,11 +1516,9 @@ class GoldenSourceConnector:
             elif 'engineering' in key_lower and 'review' in key_lower:
                 engineering_col = key
         
-        print(f"\n[Consolidation Debug]")
-        print(f"  Active Customer Column: {active_customer_col}")
-        print(f"  Media Type Column: {media_type_col}")
-        print(f"  Exclusion Column: {exclusion_col}")
-        print(f"  Engineering Review Column: {engineering_col}")
+        logger.debug("Consolidation Debug:\n  Active Customer Column: %s\n  Media Type Column: %s\n"
+                     "  Exclusion Column: %s\n  Engineering Review Column: %s",
+                     active_customer_col, media_type_col, exclusion_col, engineering_col)
         
         # Categorize records
         for record in pinellas_matches:
@@ -692,10 +1538,10 @@ class GoldenSourceConnector:
             if engineering_col and str(record.get(engineering_col, '')).strip().upper() in ['Y', 'YES', 'TRUE', '1']:
                 records_with_engineering_y.append(record)
         
-        print(f"  Active Customer Records: {len(active_customer_records)}")
-        print(f"  Fiber Media Records: {len(fiber_media_records)}")
-        print(f"  Exclusion Y Records: {len(records_with_exclusion_y)}")
-        print(f"  Engineering Review Y Records: {len(records_with_engineering_y)}")
+        logger.debug("Active Customer Records: %d, Fiber Media Records: %d, "
+                     "Exclusion Y Records: %d, Engineering Review Y Records: %d",
+                     len(active_customer_records), len(fiber_media_records),
+                     len(records_with_exclusion_y), len(records_with_engineering_y))
         
         # Rule 5: If multiple Active Customers or multiple Fiber Media, prompt manual review
         if len(active_customer_records) > 1:
@@ -718,7 +1564,7 @@ class GoldenSourceConnector:
         # Rule 1: If there is a single Active Customer, use that as base
         if len(active_customer_records) == 1:
             consolidated_record = active_customer_records[0].copy()
-            print(f"  Using Active Customer record as base")
+            logger.debug("Using Active Customer record as base")
             
             # Rule 2: If any address has Fiber Media, update the active customer record
             if fiber_media_records and media_type_col:
@@ -726,34 +1572,34 @@ class GoldenSourceConnector:
                 # Update to Fiber if current is Copper
                 if 'COPPER' in str(consolidated_record.get(media_type_col, '')).upper() or not consolidated_record.get(media_type_col):
                     consolidated_record[media_type_col] = fiber_value
-                    print(f"  Updated Media Type to: {fiber_value}")
+                    logger.debug("Updated Media Type to: %s", fiber_value)
         
         # Rule 4: If no Active Customer but there is Fiber Media, use Fiber record as base
         elif fiber_media_records:
             consolidated_record = fiber_media_records[0].copy()
-            print(f"  Using Fiber Media record as base")
+            logger.debug("Using Fiber Media record as base")
         
         # If still no base record, use the first record
         if consolidated_record is None:
             consolidated_record = pinellas_matches[0].copy()
-            print(f"  Using first record as base")
+            logger.debug("Using first record as base")
         
         # Rule 3: Update Exclusion and Engineering Review flags to 'Y' if any record has 'Y'
         if records_with_exclusion_y and exclusion_col:
             consolidated_record[exclusion_col] = 'Y'
-            print(f"  Set Exclusion flag to: Y")
+            logger.debug("Set Exclusion flag to: Y")
         elif exclusion_col and consolidated_record.get(exclusion_col) is None:
             consolidated_record[exclusion_col] = 'N'
         
         if records_with_engineering_y and engineering_col:
             consolidated_record[engineering_col] = 'Y'
-            print(f"  Set Engineering Review flag to: Y")
+            logger.debug("Set Engineering Review flag to: Y")
         elif engineering_col and consolidated_record.get(engineering_col) is None:
             consolidated_record[engineering_col] = 'N'
         
         # Rule: Use address fields from Golden Source if provided
         if golden_source_address:
-            print(f"\n  Applying Golden Source address fields to consolidated record...")
+            logger.debug("Applying Golden Source address fields to consolidated record...")
             
             # Define the address field mappings from Golden Source to Internal
             # Golden Source fields: address1, address2, Mailing City, state, zipcode
@@ -805,22 +1651,22 @@ class GoldenSourceConnector:
                     if matching_col:
                         old_value = consolidated_record[matching_col]
                         consolidated_record[matching_col] = field_value
-                        print(f"    Updated {matching_col}: '{old_value}' -> '{field_value}'")
+                        logger.debug("Updated %s: '%s' -> '%s'", matching_col, old_value, field_value)
                     else:
                         # Don't add new columns - only update existing ones
-                        print(f"    ⚠️  Warning: No matching column found for '{field_name}' (value: '{field_value}') - skipping")
-                        print(f"       Available columns: {list(consolidated_record.keys())}")
+                        logger.warning("⚠️  Warning: No matching column found for '%s' (value: '%s') - skipping. "
+                                       "Available columns: %s", field_name, field_value, list(consolidated_record.keys()))
             
             # Update city field
             if city_value and city_col:
                 old_city = consolidated_record[city_col]
                 consolidated_record[city_col] = city_value
-                print(f"    Updated {city_col}: '{old_city}' -> '{city_value}'")
+                logger.debug("Updated %s: '%s' -> '%s'", city_col, old_city, city_value)
             elif city_value:
                 # Don't add new columns - only update existing ones
-                print(f"    ⚠️  Warning: No matching city column found (value: '{city_value}') - skipping")
+                logger.warning("⚠️  Warning: No matching city column found (value: '%s') - skipping", city_value)
             
-            print(f"  ✓ Successfully applied Golden Source address to consolidated record")
+            logger.info("✓ Successfully applied Golden Source address to consolidated record")
         
         return {
             "status": "success",
@@ -841,8 +1687,7 @@ class GoldenSourceConnector:
         Returns:
             Record with Internal table column names
         """
-        print(f"\n[Mapping Golden Source to Internal Schema]")
-        print(f"  Input record keys: {list(golden_source_record.keys())}")
+        logger.debug("Mapping Golden Source to Internal Schema; input record keys: %s", list(golden_source_record.keys()))
         
         # Define the mapping from Golden Source to Internal column names
         column_mapping = {
@@ -864,20 +1709,19 @@ class GoldenSourceConnector:
                 # Only add non-empty values
                 if gs_value is not None and str(gs_value).strip() != '':
                     internal_record[internal_col] = gs_value
-                    print(f"  Mapped '{gs_col}' -> '{internal_col}' = '{gs_value}'")
+                    logger.debug("Mapped '%s' -> '%s' = '%s'", gs_col, internal_col, gs_value)
                 else:
-                    print(f"  Skipping '{gs_col}' (empty or None)")
+                    logger.debug("Skipping '%s' (empty or None)", gs_col)
             else:
                 # Column doesn't have a mapping, check if it's already in internal format
                 # (in case the record already has some internal column names)
                 if gs_col in ['Address', 'City', 'State', 'Zipcode', 'Media', 'Active Customer', 'Exclusion', 'Engineering Review']:
                     internal_record[gs_col] = gs_value
-                    print(f"  Keeping '{gs_col}' = '{gs_value}' (already in internal format)")
+                    logger.debug("Keeping '%s' = '%s' (already in internal format)", gs_col, gs_value)
                 else:
-                    print(f"  ⚠️  Warning: No mapping found for '{gs_col}' - skipping")
+                    logger.warning("⚠️  Warning: No mapping found for '%s' - skipping", gs_col)
         
-        print(f"  Output record keys: {list(internal_record.keys())}")
-        print(f"  ✓ Mapping complete")
+        logger.debug("✓ Mapping complete; output record keys: %s", list(internal_record.keys()))
         
         return internal_record
     
@@ -891,68 +1735,72 @@ class GoldenSourceConnector:
         Returns:
             Dictionary with 'status' and 'message' or 'error'
         """
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            
-            # Parse the internal_updates table name
-            updates_table = "team_cool_and_gang.internal_updates"
-            table_parts = updates_table.split('.')
-            if len(table_parts) == 2:
-                schema_name, table_name = table_parts
-                quoted_table = f'"{schema_name}"."{table_name}"'
-            else:
-                table_name = updates_table
-                quoted_table = f'"{table_name}"'
-            
-            # Build INSERT statement
-            columns = list(consolidated_record.keys())
-            values = [consolidated_record[col] for col in columns]
-            
-            # Create placeholders for parameterized query
-            placeholders = ', '.join(['%s'] * len(columns))
-            quoted_columns = ', '.join([f'"{col}"' for col in columns])
-            
-            insert_query = f'INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})'
-            
-            print(f"\n[Push to Internal Updates]")
-            print(f"Query: {insert_query}")
-            print(f"Values: {values[:5]}...")  # Show first 5 values for brevity
-            
-            cursor.execute(insert_query, values)
-            
-            # Commit the transaction
-            if not self.connection.autocommit:
-                self.connection.commit()
-            
-            print(f"  ✓ Successfully inserted record into {updates_table}")
-            
-            return {
-                "status": "success",
-                "message": f"Record successfully pushed to {updates_table}"
-            }
-            
-        except Exception as e:
-            error_msg = str(e)
-            print(f"  ✗ Error pushing to internal updates: {error_msg}")
-            
-            # Rollback on error
-            if not self.connection.autocommit:
-                try:
-                    self.connection.rollback()
-                except:
-                    pass
+        with self._connection() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                
+                # Parse the internal_updates table name
+                updates_table = _INTERNAL_UPDATES_TABLE
+                table_parts = updates_table.split('.')
+                if len(table_parts) == 2:
+                    schema_name, table_name = table_parts
+                    quoted_table = f'"{schema_name}"."{table_name}"'
+                else:
+                    schema_name = None
+                    table_name = updates_table
+                    quoted_table = f'"{table_name}"'
+                
+                # Build INSERT statement
+                columns = list(consolidated_record.keys())
+                values = [consolidated_record[col] for col in columns]
+                
+                # Create placeholders for parameterized query; column names must exist in the table
+                placeholders = ', '.join(['%s'] * len(columns))
+                known_columns = self._get_table_columns(cursor, schema_name, table_name)
+                quoted_columns = ', '.join([_quote_column(col, known_columns) for col in columns])
+                
+                insert_query = f'INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})'
+                
+                logger.debug("Push to Internal Updates:\nQuery: %s\nValues: %s...", insert_query, values[:5])  # First 5 values for brevity
+                
+                cursor.execute(insert_query, values)
+                
+                # Commit the transaction
+                if not connection.autocommit:
+                    connection.commit()
+                
+                logger.info("✓ Successfully inserted record into %s", updates_table)
+                
+                return {
+                    "status": "success",
+                    "message": f"Record successfully pushed to {updates_table}"
+                }
             
-            return {
-                "status": "error",
-                "error": f"Failed to push update: {error_msg}"
-            }
-        finally:
-            if cursor:
-                cursor.close()
+            except Exception as e:
+                error_msg = str(e)
+                logger.error("✗ Error pushing to internal updates: %s", error_msg)
+                
+                # Rollback on error
+                if not connection.autocommit:
+                    try:
+                        connection.rollback()
+                    except:
+                        pass
+                
+                return {
+                    "status": "error",
+                    "error": f"Failed to push update: {error_msg}"
+                }
+            finally:
+                if cursor:
+                    cursor.close()
     
     def close(self):
-        """Close the database connection."""
+        """Close the database connection (the shared pool closes once every connector has closed)."""
         if self.connection:
             self.connection.close()
+        if self._pool is not None:
+            _release_pool()
+            self._pool = None
 
@@ -0,0 +1,93 @@
+"""Module for bit-parallel Levenshtein edit distance (Myers 1999 / Hyyro 2001)."""
+from typing import Dict
+
+try:
+    # Optional: compiles the 64-bit kernel to native code
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _myers_python(pattern: bytes, text: bytes) -> int:
+    """Edit distance using Python ints as bitvectors (works for any pattern length)."""
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    # Bitmask of pattern positions for each byte value
+    peq: Dict[int, int] = {}
+    for i, byte in enumerate(pattern):
+        peq[byte] = peq.get(byte, 0) | (1 << i)
+
+    pv = mask
+    mv = 0
+    score = m
+    for byte in text:
+        eq = peq.get(byte, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _myers64(pattern, text):
+        """Edit distance with uint64 bitvectors; pattern must be 1-64 bytes."""
+        m = pattern.shape[0]
+        one = np.uint64(1)
+        peq = np.zeros(256, dtype=np.uint64)
+        for i in range(m):
+            peq[pattern[i]] |= one << np.uint64(i)
+
+        high = one << np.uint64(m - 1)
+        pv = ~np.uint64(0)
+        mv = np.uint64(0)
+        score = m
+        for j in range(text.shape[0]):
+            eq = peq[text[j]]
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            ph = (ph << one) | one
+            mh = mh << one
+            pv = mh | ~(xv | ph)
+            mv = ph & xv
+
+        return score
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    Return the Levenshtein edit distance between two strings (compared as UTF-8 bytes).
+
+    Uses the numba-compiled 64-bit kernel when numba is installed and the shorter string
+    fits in 64 bytes, otherwise the pure Python implementation.
+    """
+    a_bytes = a.encode('utf-8')
+    b_bytes = b.encode('utf-8')
+    if len(a_bytes) > len(b_bytes):
+        a_bytes, b_bytes = b_bytes, a_bytes
+
+    if njit is not None and 0 < len(a_bytes) <= 64:
+        return int(_myers64(np.frombuffer(a_bytes, dtype=np.uint8), np.frombuffer(b_bytes, dtype=np.uint8)))
+    return _myers_python(a_bytes, b_bytes)
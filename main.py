@@ -1,6 +1,8 @@
 """Main entry point for OneTrueAddress agent."""
 import sys
+import logging
 from address_agent import AddressAgent
+from config import LOG_LEVEL
 
 
 def main():
@@ -11,6 +13,8 @@ def main():
         print("  python main.py '123 Main St, New York, NY 10001'")
         sys.exit(1)
     
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
+    
     # Get the input address from command line arguments
     input_address = " ".join(sys.argv[1:])
     
@@ -9,9 +9,13 @@ if sys.platform == 'win32':
 
 from flask import Flask, render_template, request, jsonify
 from address_agent import AddressAgent
+from config import LOG_LEVEL
+import logging
 import traceback
 import atexit
 
+logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
+
 app = Flask(__name__)
 
 # Global agent instance (initialized on first use)
@@ -92,6 +96,9 @@ def match_address():
                 # Include no internal match flag
                 no_internal_match = result.get('no_internal_match', False)
                 response_data['no_internal_match'] = no_internal_match
+                
+                # Set when the internal lookup timed out (which is not the same as no internal match)
+                response_data['pinellas_error'] = result.get('pinellas_error')
         else:
             response_data['match_found'] = False
             response_data['raw_response'] = result.get('raw_response', 'No response')